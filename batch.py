@@ -0,0 +1,213 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from bitboard import BitboardEngine
+from corpus import BoardCorpus
+from engine import (BOARD_SIZE, DEFAULT_BOMB_COUNT, STEP_LIMIT, OUTCOME_WIN, OUTCOME_LOSS,
+                    OUTCOME_STUCK, MinesweeperEngine, game_rng, play_rng)
+from stats import (DEFAULT_CONFIDENCE, DEFAULT_INTERVAL, MIN_GAMES, SequentialComparison, format_interval,
+                   precision_reached)
+
+# Games handed to a worker at a time; several chunks per worker keep the pool balanced
+CHUNKS_PER_WORKER = 4
+
+# Early-stopping runs: most games they may play, games per chunk (so little
+# work is in flight when they stop) and how often the stopping rule is checked
+EARLY_STOP_MAX_GAMES = 100000
+EARLY_STOP_CHUNK = 25
+EARLY_STOP_CHECK_GAMES = 10
+
+
+def play_games(solver_type, start, stop, master_seed, board_size=BOARD_SIZE,
+               bomb_count=DEFAULT_BOMB_COUNT, step_limit=STEP_LIMIT, bitboard=False, corpus_path=None,
+               safe_first_click=False, cols=None):
+    """Plays games start..stop-1 of a batch and returns their outcomes in order.
+
+    Boards are board_size rows by cols columns (board_size when cols is None).
+    With corpus_path, game i is played on board i of that corpus file, and
+    the board shape and bomb_count come from its header. Either way the
+    solver plays from play_rng(master_seed, i), so a corpus written with
+    master_seed plays the same games as generated boards. With
+    safe_first_click the deal waits for the first click and so draws from
+    that stream too.
+    """
+    engine_class = BitboardEngine if bitboard else MinesweeperEngine
+    engine = engine_class(board_size, bomb_count, step_limit, rng=game_rng(master_seed, start),
+                          cols=cols, safe_first_click=safe_first_click)
+    corpus = BoardCorpus(corpus_path) if corpus_path is not None else None
+    outcomes = []
+    for game_index in range(start, stop):
+        if corpus is not None:
+            corpus.load(engine, game_index)
+        else:
+            engine.rng = game_rng(master_seed, game_index)
+            engine.new_game()
+        engine.rng = play_rng(master_seed, game_index)
+        outcomes.append(engine.play(solver_type))
+    if corpus is not None:
+        corpus.close()
+    return outcomes
+
+
+def iter_outcomes(solver_type, games=1000, workers=None, master_seed=0, board_size=BOARD_SIZE,
+                  bomb_count=DEFAULT_BOMB_COUNT, step_limit=STEP_LIMIT, bitboard=False, corpus_path=None,
+                  safe_first_click=False, cols=None, chunk_size=None):
+    """Yields (game_index, outcome) for every game of a batch, in game order.
+
+    Closing the generator early cancels the chunks that have not started.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if chunk_size is None:
+        chunk_size = max(1, -(-games // (workers * CHUNKS_PER_WORKER)))
+    starts = list(range(0, games, chunk_size))
+    stops = [min(start + chunk_size, games) for start in starts]
+    n_chunks = len(starts)
+    args = ([solver_type] * n_chunks, starts, stops, [master_seed] * n_chunks,
+            [board_size] * n_chunks, [bomb_count] * n_chunks, [step_limit] * n_chunks,
+            [bitboard] * n_chunks, [corpus_path] * n_chunks, [safe_first_click] * n_chunks,
+            [cols] * n_chunks)
+
+    if workers <= 1:
+        yield from _flatten(starts, map(play_games, *args))
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        yield from _flatten(starts, executor.map(play_games, *args))
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _flatten(starts, chunk_results):
+    for start, outcomes in zip(starts, chunk_results):
+        for offset, outcome in enumerate(outcomes):
+            yield start + offset, outcome
+
+
+def run_batch(solver_type, games=1000, workers=None, master_seed=0, board_size=BOARD_SIZE,
+              bomb_count=DEFAULT_BOMB_COUNT, step_limit=STEP_LIMIT, bitboard=False, corpus_path=None,
+              safe_first_click=False, cols=None):
+    """Plays a seeded batch across a process pool and returns the merged counts."""
+    counts = new_counts()
+    for _, outcome in iter_outcomes(solver_type, games, workers, master_seed, board_size,
+                                    bomb_count, step_limit, bitboard, corpus_path, safe_first_click, cols):
+        add_outcome(counts, outcome)
+    return counts
+
+
+def iter_until_precise(solver_type, half_width, max_games=EARLY_STOP_MAX_GAMES, workers=None, master_seed=0,
+                       board_size=BOARD_SIZE, bomb_count=DEFAULT_BOMB_COUNT, step_limit=STEP_LIMIT, bitboard=False,
+                       corpus_path=None, safe_first_click=False, cols=None, method=DEFAULT_INTERVAL,
+                       confidence=DEFAULT_CONFIDENCE, min_games=MIN_GAMES):
+    """Like iter_outcomes, but stops once the win-rate interval is at most +-half_width wide.
+
+    The games played are games 0..n-1 of the same seeded batch run_batch plays.
+    """
+    games = 0
+    wins = 0
+    outcomes = iter_outcomes(solver_type, max_games, workers, master_seed, board_size, bomb_count, step_limit,
+                             bitboard, corpus_path, safe_first_click, cols, EARLY_STOP_CHUNK)
+    try:
+        for game_index, outcome in outcomes:
+            yield game_index, outcome
+            games += 1
+            wins += outcome == OUTCOME_WIN
+            if games % EARLY_STOP_CHECK_GAMES == 0 and precision_reached(wins, games, half_width, method,
+                                                                         confidence, min_games):
+                return
+    finally:
+        outcomes.close()
+
+
+def run_to_precision(solver_type, half_width, max_games=EARLY_STOP_MAX_GAMES, workers=None, master_seed=0,
+                     board_size=BOARD_SIZE, bomb_count=DEFAULT_BOMB_COUNT, step_limit=STEP_LIMIT, bitboard=False,
+                     corpus_path=None, safe_first_click=False, cols=None, method=DEFAULT_INTERVAL,
+                     confidence=DEFAULT_CONFIDENCE, min_games=MIN_GAMES):
+    """Plays a seeded batch until its win-rate interval is at most +-half_width; returns the merged counts."""
+    counts = new_counts()
+    for _, outcome in iter_until_precise(solver_type, half_width, max_games, workers, master_seed, board_size,
+                                         bomb_count, step_limit, bitboard, corpus_path, safe_first_click, cols,
+                                         method, confidence, min_games):
+        add_outcome(counts, outcome)
+    return counts
+
+
+def iter_comparison(solver_a, solver_b, comparison, max_games=EARLY_STOP_MAX_GAMES, workers=None, master_seed=0,
+                    board_size=BOARD_SIZE, bomb_count=DEFAULT_BOMB_COUNT, step_limit=STEP_LIMIT, bitboard=False,
+                    corpus_path=None, safe_first_click=False, cols=None):
+    """Yields (game_index, outcome_a, outcome_b) with both solvers playing the same seeded boards.
+
+    Every pair is fed to comparison (a stats.SequentialComparison), and the
+    games stop once it decides or after max_games. Each solver gets half the workers.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, workers // 2)
+    batch_args = (max_games, workers, master_seed, board_size, bomb_count, step_limit, bitboard, corpus_path,
+                  safe_first_click, cols, EARLY_STOP_CHUNK)
+    outcomes_a = iter_outcomes(solver_a, *batch_args)
+    outcomes_b = iter_outcomes(solver_b, *batch_args)
+    try:
+        for (game_index, outcome_a), (_, outcome_b) in zip(outcomes_a, outcomes_b):
+            yield game_index, outcome_a, outcome_b
+            if comparison.add(outcome_a == OUTCOME_WIN, outcome_b == OUTCOME_WIN) is not None:
+                return
+    finally:
+        outcomes_a.close()
+        outcomes_b.close()
+
+
+def compare_solvers(solver_a, solver_b, max_games=EARLY_STOP_MAX_GAMES, workers=None, master_seed=0,
+                    board_size=BOARD_SIZE, bomb_count=DEFAULT_BOMB_COUNT, step_limit=STEP_LIMIT, bitboard=False,
+                    corpus_path=None, safe_first_click=False, cols=None):
+    """Plays both solvers on the same seeded boards until a SequentialComparison decides.
+
+    Returns (decision, counts_a, counts_b); the decision is None when
+    max_games were played without one.
+    """
+    comparison = SequentialComparison()
+    counts_a = new_counts()
+    counts_b = new_counts()
+    for _, outcome_a, outcome_b in iter_comparison(solver_a, solver_b, comparison, max_games, workers, master_seed,
+                                                   board_size, bomb_count, step_limit, bitboard, corpus_path,
+                                                   safe_first_click, cols):
+        add_outcome(counts_a, outcome_a)
+        add_outcome(counts_b, outcome_b)
+    return comparison.decision(), counts_a, counts_b
+
+
+def new_counts():
+    return {"games": 0, OUTCOME_WIN: 0, OUTCOME_LOSS: 0, OUTCOME_STUCK: 0}
+
+
+def add_outcome(counts, outcome):
+    counts["games"] += 1
+    counts[outcome] += 1
+
+
+def format_summary(solver_type, bomb_count, counts, stopped=False, master_seed=None, method=DEFAULT_INTERVAL,
+                   confidence=DEFAULT_CONFIDENCE):
+    """Builds the auto run result message shown at the end of a batch, with the win-rate interval."""
+    games = counts["games"]
+    success_rate = (counts[OUTCOME_WIN] / games) * 100 if games else 0.0
+
+    if stopped:
+        header = f"Auto {solver_type} Solver - STOPPED"
+        total_line = f"Total Runs Completed: {games}"
+    else:
+        header = f"Auto {solver_type} Solver - {games} Runs Completed"
+        total_line = f"Total Runs: {games}"
+
+    seed_line = f"\nSeed: {master_seed}" if master_seed is not None else ""
+
+    return f"""{header}
+
+Bomb Count: {bomb_count}{seed_line}
+{total_line}
+Wins: {counts[OUTCOME_WIN]}
+Losses: {counts[OUTCOME_LOSS]}
+Stuck: {counts[OUTCOME_STUCK]}
+Success Rate: {success_rate:.1f}%
+Interval: {format_interval(counts[OUTCOME_WIN], games, method, confidence)}"""
@@ -0,0 +1,237 @@
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+
+from bitboard import BitboardEngine
+from engine import SOLVER_TYPES, MinesweeperEngine, game_rng
+
+# Default benchmark matrix
+BENCH_SIZES = [15, 30, 60]
+BENCH_DENSITIES = [0.10, 0.15, 0.20]
+BENCH_GAMES = 30
+BENCH_SEED = 0
+BENCH_SOLVER = "CSP"
+
+# Passes over the benchmark matrix; each time keeps its best pass, since noise
+# from the rest of the machine only ever makes a pass slower
+BENCH_REPEATS = 5
+
+# Engine methods whose per-call latency is recorded
+TIMED_METHODS = ["cp_solver_step", "csp_solver_1ply_step", "get_frontier_cells", "flood_open"]
+
+# Relative slowdown reported as a regression by --compare
+REGRESSION_THRESHOLD = 0.10
+
+# Report settings that must match before two reports are compared
+COMPARED_META = ["solver", "bitboard", "games", "seed", "repeats"]
+
+
+def timed(method, samples):
+    """Wraps a bound method so every call appends its duration in ns to samples."""
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            samples.append(time.perf_counter_ns() - start)
+    return wrapper
+
+
+def latency_stats(samples):
+    if not samples:
+        return {"calls": 0, "mean_ns": 0, "p50_ns": 0, "p95_ns": 0}
+    ordered = sorted(samples)
+    return {
+        "calls": len(ordered),
+        "mean_ns": sum(ordered) // len(ordered),
+        "p50_ns": ordered[len(ordered) // 2],
+        "p95_ns": ordered[min(len(ordered) - 1, len(ordered) * 95 // 100)],
+    }
+
+
+def bench_config(size, density, games=BENCH_GAMES, seed=BENCH_SEED, solver_type=BENCH_SOLVER,
+                 bitboard=False):
+    """Benchmarks one board size and mine density; returns a JSON-ready dict.
+
+    Board generation and whole games are timed without any wrappers; the
+    per-call latencies come from a second run of the same seeded games with
+    the TIMED_METHODS wrapped. The step limit is the cell count, so every game
+    is played until it is won, lost or stuck.
+    """
+    bomb_count = max(1, round(size * size * density))
+    engine_class = BitboardEngine if bitboard else MinesweeperEngine
+    engine = engine_class(size, bomb_count, size * size, rng=game_rng(seed, -1))
+
+    # Untimed warm-up game, so one-off costs such as building the pattern table are not measured
+    engine.play(solver_type)
+
+    start = time.perf_counter_ns()
+    for game_index in range(games):
+        engine.rng = game_rng(seed, game_index)
+        engine.new_game()
+    generate_ns = (time.perf_counter_ns() - start) // games
+
+    outcomes = {}
+    start = time.perf_counter_ns()
+    for game_index in range(games):
+        engine.rng = game_rng(seed, game_index)
+        engine.new_game()
+        outcome = engine.play(solver_type)
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+    elapsed_ns = time.perf_counter_ns() - start
+
+    samples = {name: [] for name in TIMED_METHODS}
+    for name in TIMED_METHODS:
+        setattr(engine, name, timed(getattr(engine, name), samples[name]))
+    for game_index in range(games):
+        engine.rng = game_rng(seed, game_index)
+        engine.new_game()
+        engine.play(solver_type)
+
+    return {
+        "rows": size,
+        "cols": size,
+        "bombs": bomb_count,
+        "density": density,
+        "games": games,
+        "outcomes": outcomes,
+        "generate_ns_per_board": generate_ns,
+        "games_per_sec": games * 1e9 / elapsed_ns,
+        "calls": {name: latency_stats(samples[name]) for name in TIMED_METHODS},
+    }
+
+
+def best_of(result, other):
+    """Merges two passes over the same configuration, keeping the better value of every time."""
+    result["generate_ns_per_board"] = min(result["generate_ns_per_board"], other["generate_ns_per_board"])
+    result["games_per_sec"] = max(result["games_per_sec"], other["games_per_sec"])
+    for name, stats in result["calls"].items():
+        for field in ("mean_ns", "p50_ns", "p95_ns"):
+            stats[field] = min(stats[field], other["calls"][name][field])
+    return result
+
+
+def run_benchmarks(sizes=BENCH_SIZES, densities=BENCH_DENSITIES, games=BENCH_GAMES, seed=BENCH_SEED,
+                   solver_type=BENCH_SOLVER, bitboard=False, repeats=BENCH_REPEATS):
+    """Runs the whole size x density matrix repeats times and returns the report dict.
+
+    Every time in the report is the best of its repeats. The repeats go round
+    the whole matrix rather than one configuration at a time, so a slow
+    stretch of the machine does not cover all the passes of one
+    configuration. The garbage collector is off while it runs, like in
+    timeit, so a collection does not land in one pass and not another.
+    """
+    configs = [(size, density) for size in sizes for density in densities]
+    results = [None] * len(configs)
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            for i, (size, density) in enumerate(configs):
+                result = bench_config(size, density, games, seed, solver_type, bitboard)
+                results[i] = result if results[i] is None else best_of(results[i], result)
+    finally:
+        gc.enable()
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "solver": solver_type,
+            "bitboard": bitboard,
+            "games": games,
+            "seed": seed,
+            "repeats": repeats,
+        },
+        "results": results,
+    }
+
+
+def compare_reports(baseline, current, threshold=REGRESSION_THRESHOLD):
+    """Returns one line per metric that got worse by more than threshold.
+
+    Configurations are matched on (rows, cols, bombs); times regress when they
+    grow and games_per_sec when it shrinks. Raises ValueError when the reports
+    were run with different COMPARED_META settings, e.g. another solver, since
+    their numbers do not measure the same thing.
+    """
+    mismatches = [f"{field} {baseline['meta'].get(field)!r} vs {current['meta'].get(field)!r}"
+                  for field in COMPARED_META if baseline["meta"].get(field) != current["meta"].get(field)]
+    if mismatches:
+        raise ValueError("reports were run with different settings: " + ", ".join(mismatches))
+
+    baseline_results = {(r["rows"], r["cols"], r["bombs"]): r for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        key = (result["rows"], result["cols"], result["bombs"])
+        old = baseline_results.get(key)
+        if old is None:
+            continue
+        label = f"{key[0]}x{key[1]}/{key[2]}"
+
+        metrics = [("games_per_sec", old["games_per_sec"], result["games_per_sec"], False),
+                   ("generate_ns_per_board", old["generate_ns_per_board"],
+                    result["generate_ns_per_board"], True)]
+        for name in TIMED_METHODS:
+            if name in old["calls"] and name in result["calls"]:
+                metrics.append((f"{name} mean_ns", old["calls"][name]["mean_ns"],
+                                result["calls"][name]["mean_ns"], True))
+
+        for metric, old_value, new_value, lower_is_better in metrics:
+            if not old_value:
+                continue
+            change = (new_value - old_value) / old_value
+            if (change > threshold) if lower_is_better else (change < -threshold):
+                regressions.append(f"{label} {metric}: {old_value:.6g} -> {new_value:.6g} ({change:+.1%})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark solver throughput and per-call latency.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=BENCH_SIZES)
+    parser.add_argument("--densities", type=float, nargs="+", default=BENCH_DENSITIES)
+    parser.add_argument("--games", type=int, default=BENCH_GAMES)
+    parser.add_argument("--seed", type=int, default=BENCH_SEED)
+    parser.add_argument("--solver", choices=SOLVER_TYPES, default=BENCH_SOLVER)
+    parser.add_argument("--repeats", type=int, default=BENCH_REPEATS,
+                        help="passes over the matrix; every time reported is the best one")
+    parser.add_argument("--bitboard", action="store_true", help="benchmark BitboardEngine")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--compare", metavar="BASELINE", help="flag regressions against a stored report")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    args = parser.parse_args(argv)
+    if args.games < 1:
+        parser.error("--games must be at least 1")
+    if args.repeats < 1:
+        parser.error("--repeats must be at least 1")
+
+    report = run_benchmarks(args.sizes, args.densities, args.games, args.seed, args.solver, args.bitboard,
+                            args.repeats)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        try:
+            regressions = compare_reports(baseline, report, args.threshold)
+        except ValueError as e:
+            print(f"Cannot compare with {args.compare}: {e}", file=sys.stderr)
+            return 2
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+        print("No regressions.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
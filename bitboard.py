@@ -0,0 +1,401 @@
+import instrument
+from engine import MinesweeperEngine
+
+# Sentinel rows above and below the board keep neighbor lookups free of bounds tests
+ROW_PAD = 1
+
+
+class _StatusRow:
+    """One row of board_status, decoded from the opened / flagged bitsets."""
+
+    __slots__ = ("board", "r")
+
+    def __init__(self, board, r):
+        self.board = board
+        self.r = r + ROW_PAD
+
+    def __getitem__(self, c):
+        bit = 1 << c
+        if self.board.opened[self.r] & bit:
+            return 'O'
+        if self.board.flagged[self.r] & bit:
+            return 'F'
+        return 'H'
+
+    def __setitem__(self, c, status):
+        bit = 1 << c
+        board = self.board
+        board.opened[self.r] &= ~bit
+        board.flagged[self.r] &= ~bit
+        if status == 'O':
+            board.opened[self.r] |= bit
+        elif status == 'F':
+            board.flagged[self.r] |= bit
+
+
+class _LogicRow:
+    """One row of board_logic: bombs from the mine bitset, numbers from a bytearray."""
+
+    __slots__ = ("board", "r", "offset")
+
+    def __init__(self, board, r):
+        self.board = board
+        self.r = r + ROW_PAD
+        self.offset = r * board.cols
+
+    def __getitem__(self, c):
+        if self.board.mines[self.r] >> c & 1:
+            return -1
+        return self.board.numbers[self.offset + c]
+
+    def __setitem__(self, c, value):
+        bit = 1 << c
+        if value == -1:
+            self.board.mines[self.r] |= bit
+            self.board.numbers[self.offset + c] = 0
+        else:
+            self.board.mines[self.r] &= ~bit
+            self.board.numbers[self.offset + c] = value
+
+
+# Bitboard Engine
+class BitboardEngine(MinesweeperEngine):
+    """MinesweeperEngine storing mines, opened and flagged cells as per-row bitsets.
+
+    Every row is a Python int with bit c set for column c. Neighbor questions are
+    answered with popcounts of the three rows around a cell ANDed with a
+    precomputed column window, instead of eight bounds-checked lookups.
+    board_logic / board_status are row accessors over the bitsets, so the solvers
+    in MinesweeperEngine run on this board unchanged. The hot paths (the CP
+    sweep, flood fill and the bookkeeping after a flood) are overridden to work
+    on whole row masks instead of going through those accessors cell by cell.
+    """
+
+    def allocate_board(self):
+        if getattr(self, "window_masks", None) is None or len(self.window_masks) != self.cols:
+            self.build_neighbor_masks()
+
+        padded_rows = self.rows + 2 * ROW_PAD
+        self.mines = [0] * padded_rows
+        self.opened = [0] * padded_rows
+        # Sentinel rows read as opened, so they never contribute hidden neighbors
+        self.opened[0] = self.opened[-1] = (1 << self.cols) - 1
+        self.flagged = [0] * padded_rows
+        # Non-mine cells with no mine around them, i.e. the cells a flood fill spreads from;
+        # the sentinel rows count as opened zeros, so they are never an opened number
+        self.zeros = [0] * padded_rows
+        self.zeros[0] = self.zeros[-1] = (1 << self.cols) - 1
+        self.numbers = bytearray(self.rows * self.cols)
+        # CP worklist as row masks: dirty_rows for the next sweep, sweep_rows still
+        # ahead in the running one, which is at (sweep_row, sweep_col)
+        self.dirty_rows = [0] * padded_rows
+        self.sweep_rows = [0] * padded_rows
+        self.sweep_row = self.rows + ROW_PAD
+        self.sweep_col = -1
+        self.board_logic = [_LogicRow(self, r) for r in range(self.rows)]
+        self.board_status = [_StatusRow(self, r) for r in range(self.rows)]
+
+    def build_neighbor_masks(self):
+        """Precomputes, per column, the 3-wide window and the window minus the cell itself."""
+        full_row = (1 << self.cols) - 1
+        self.window_masks = []
+        self.side_masks = []
+        for c in range(self.cols):
+            window = (0b111 << c >> 1) & full_row
+            self.window_masks.append(window)
+            self.side_masks.append(window & ~(1 << c))
+
+    def fill_board(self, board_logic):
+        for r, row in enumerate(board_logic):
+            zero_row = 0
+            for c, value in enumerate(row):
+                self.board_logic[r][c] = value
+                if value == 0:
+                    zero_row |= 1 << c
+            self.zeros[r + ROW_PAD] = zero_row
+
+    def plant_mine_bits(self, mine_bits):
+        full_row = (1 << self.cols) - 1
+        self.mine_indices = []
+        for r in range(self.rows):
+            row_bits = (mine_bits >> (r * self.cols)) & full_row
+            self.mines[r + ROW_PAD] = row_bits
+            while row_bits:
+                low = row_bits & -row_bits
+                self.mine_indices.append(r * self.cols + low.bit_length() - 1)
+                row_bits ^= low
+        self.bomb_count = len(self.mine_indices)
+
+    def calculate_neighbor_numbers(self):
+        """Counts every cell's mine neighbors at once, as byte lanes of one big int.
+
+        The mines are laid out one byte per cell on a grid with a blank border,
+        and that grid read as an int is shifted by each of the 8 neighbor
+        offsets and summed; a count never exceeds 8, so no lane carries into the
+        next. The numbers of mine cells come out as counts too; board_logic
+        reads -1 for them from the mine bitset instead.
+        """
+        cols = self.cols
+        width = cols + 2
+        grid = bytearray(width * (self.rows + 2))
+        for r in range(self.rows):
+            row_bits = self.mines[r + ROW_PAD]
+            offset = (r + 1) * width + 1
+            while row_bits:
+                low = row_bits & -row_bits
+                grid[offset + low.bit_length() - 1] = 1
+                row_bits ^= low
+
+        lanes = int.from_bytes(grid, "little")
+        counts = 0
+        for shift in (8, 8 * (width - 1), 8 * width, 8 * (width + 1)):
+            counts += (lanes >> shift) + (lanes << shift)
+        counts = counts.to_bytes(len(grid) + width + 2, "little")
+
+        mines = self.mines
+        full_row = (1 << cols) - 1
+        for r in range(self.rows):
+            offset = (r + 1) * width + 1
+            self.numbers[r * cols:(r + 1) * cols] = counts[offset:offset + cols]
+            around = mines[r] | mines[r + 1] | mines[r + 2]
+            self.zeros[r + 1] = full_row & ~(around | around << 1 | around >> 1)
+
+    def _neighbor_popcount(self, bitset, r, c):
+        window = self.window_masks[c]
+        return ((bitset[r] & window).bit_count()
+                + (bitset[r + 1] & self.side_masks[c]).bit_count()
+                + (bitset[r + 2] & window).bit_count())
+
+    def flagged_neighbor_count(self, r, c):
+        return self._neighbor_popcount(self.flagged, r, c)
+
+    def hidden_neighbor_masks(self, r, c):
+        """Returns the hidden-neighbor bits of (r, c) for the rows above, at and below it."""
+        opened = self.opened
+        flagged = self.flagged
+        window = self.window_masks[c]
+        return (window & ~(opened[r] | flagged[r]),
+                self.side_masks[c] & ~(opened[r + 1] | flagged[r + 1]),
+                window & ~(opened[r + 2] | flagged[r + 2]))
+
+    def neighbor_state(self, r, c):
+        hidden_neighbors = []
+        for nr, bits in enumerate(self.hidden_neighbor_masks(r, c), r - 1):
+            while bits:
+                low = bits & -bits
+                hidden_neighbors.append((nr, low.bit_length() - 1))
+                bits ^= low
+        return hidden_neighbors, self.flagged_neighbor_count(r, c)
+
+    def neighbor_counts(self, r, c):
+        above, row, below = self.hidden_neighbor_masks(r, c)
+        hidden_count = above.bit_count() + row.bit_count() + below.bit_count()
+        return hidden_count, self.flagged_neighbor_count(r, c)
+
+    def mask_cells(self, padded_row, bits):
+        """Returns the (r, c) cells of the set bits of one padded row, in column order."""
+        r = padded_row - ROW_PAD
+        cells = []
+        while bits:
+            low = bits & -bits
+            cells.append((r, low.bit_length() - 1))
+            bits ^= low
+        return cells
+
+    def mark_dirty(self, padded_row, bits):
+        """Queues the cells of bits in one padded row for a CP check.
+
+        Like MinesweeperEngine.cell_changed, cells still ahead of the running
+        sweep join it and the rest wait for the next sweep.
+        """
+        if padded_row > self.sweep_row:
+            self.sweep_rows[padded_row] |= bits
+        elif padded_row < self.sweep_row:
+            self.dirty_rows[padded_row] |= bits
+        else:
+            ahead = bits >> (self.sweep_col + 1) << (self.sweep_col + 1)
+            self.sweep_rows[padded_row] |= ahead
+            self.dirty_rows[padded_row] |= bits ^ ahead
+
+    def cell_changed(self, r, c):
+        self.changed_cells.append((r, c))
+        self.update_frontier(r, c)
+
+        window = self.window_masks[c]
+        row = r + ROW_PAD
+        for nrow in range(row - 1 if r > 0 else row, row + 2 if r + 1 < self.rows else row + 1):
+            self.mark_dirty(nrow, window)
+
+    def update_frontier(self, r, c):
+        row = r + ROW_PAD
+        bit = 1 << c
+        if self.opened[row] & bit:
+            self.frontier.discard((r, c))
+            if not (self.mines[row] | self.zeros[row]) & bit:
+                self.frontier.update(self.neighbor_state(r, c)[0])
+        elif self.flagged[row] & bit:
+            self.frontier.discard((r, c))
+        else:
+            # Unflagged: back on the frontier if it touches an opened number
+            window = self.window_masks[c]
+            for nrow in (row - 1, row, row + 1):
+                if self.opened[nrow] & ~(self.mines[nrow] | self.zeros[nrow]) & window:
+                    self.frontier.add((r, c))
+                    break
+
+    def flood_open(self, r, c):
+        """Opens (r, c) and the zero region around it, like MinesweeperEngine.flood_open.
+
+        The region grows a row mask at a time: every pass dilates the zero
+        cells opened by the previous pass into the hidden cells of the rows
+        around them. Returns the opened cells.
+        """
+        if not (0 <= r < self.rows and 0 <= c < self.cols):
+            return []
+        start_row = r + ROW_PAD
+        opened = self.opened
+        flagged = self.flagged
+        zeros = self.zeros
+        if (opened[start_row] | flagged[start_row]) >> c & 1:
+            return []
+
+        opened[start_row] |= 1 << c
+        if not zeros[start_row] >> c & 1:
+            # A number (or a mine): nothing spreads, so it is an ordinary single-cell change
+            self.cell_changed(r, c)
+            self.cells_opened += 1
+            return [(r, c)]
+
+        full_row = (1 << self.cols) - 1
+        region = {start_row: 1 << c}
+        grow = {start_row: 1 << c}
+        while grow:
+            next_grow = {}
+            for row, bits in grow.items():
+                spread = (bits | bits << 1 | bits >> 1) & full_row
+                for nrow in (row - 1, row, row + 1):
+                    # Sentinel rows read as opened, so nothing is added to them
+                    added = spread & ~(opened[nrow] | flagged[nrow])
+                    if added:
+                        opened[nrow] |= added
+                        region[nrow] = region.get(nrow, 0) | added
+                        added &= zeros[nrow]
+                        if added:
+                            next_grow[nrow] = next_grow.get(nrow, 0) | added
+            grow = next_grow
+
+        opened_cells = []
+        for row in sorted(region):
+            opened_cells.extend(self.mask_cells(row, region[row]))
+        self.region_opened(region, opened_cells)
+        self.cells_opened += len(opened_cells)
+        return opened_cells
+
+    def region_opened(self, region, opened_cells):
+        """cell_changed for a whole flood region at once: view, frontier and CP worklist."""
+        self.changed_cells.extend(opened_cells)
+        full_row = (1 << self.cols) - 1
+        last_row = self.rows + ROW_PAD - 1
+        opened = self.opened
+        flagged = self.flagged
+        mines = self.mines
+        zeros = self.zeros
+
+        # The region leaves the frontier and the hidden neighbors of its numbers join it
+        frontier = self.frontier
+        frontier.difference_update(opened_cells)
+        touched = {}
+        numbered = {}
+        for row, bits in region.items():
+            spread = (bits | bits << 1 | bits >> 1) & full_row
+            numbers = bits & ~(zeros[row] | mines[row])
+            number_spread = (numbers | numbers << 1 | numbers >> 1) & full_row
+            for nrow in (row - 1, row, row + 1):
+                if ROW_PAD <= nrow <= last_row:
+                    touched[nrow] = touched.get(nrow, 0) | spread
+                    numbered[nrow] = numbered.get(nrow, 0) | number_spread
+        for row, bits in numbered.items():
+            hidden = bits & ~(opened[row] | flagged[row])
+            if hidden:
+                frontier.update(self.mask_cells(row, hidden))
+
+        for row, bits in touched.items():
+            self.mark_dirty(row, bits)
+
+    def cp_solver_step(self):
+        """MinesweeperEngine.cp_solver_step on the row-mask worklist.
+
+        The sweep visits the dirty cells in the same row-major order, but reads
+        each cell's constraint from its neighbor masks; the hidden neighbors
+        are only listed when the constraint forces a move.
+        """
+        if self.game_over:
+            return False
+
+        change_made_in_step = False
+        cells_scanned = 0
+        constraint_checks = 0
+        numbers = self.numbers
+        mines = self.mines
+        opened = self.opened
+        flagged = self.flagged
+        zeros = self.zeros
+        window_masks = self.window_masks
+        side_masks = self.side_masks
+        cols = self.cols
+
+        sweep_rows = self.sweep_rows = self.dirty_rows
+        self.dirty_rows = [0] * len(sweep_rows)
+        for row in range(ROW_PAD, self.rows + ROW_PAD):
+            if not sweep_rows[row]:
+                continue
+            self.sweep_row = row
+            self.sweep_col = -1
+            offset = (row - ROW_PAD) * cols
+            while sweep_rows[row]:
+                bits = sweep_rows[row]
+                low = bits & -bits
+                sweep_rows[row] = bits ^ low
+                c = low.bit_length() - 1
+                self.sweep_col = c
+                cells_scanned += 1
+
+                # Only opened number cells carry a constraint
+                if not opened[row] & low or (mines[row] | zeros[row]) & low:
+                    continue
+                constraint_checks += 1
+
+                window = window_masks[c]
+                side = side_masks[c]
+                flagged_count = ((flagged[row - 1] & window).bit_count() + (flagged[row] & side).bit_count()
+                                 + (flagged[row + 1] & window).bit_count())
+                hidden_count = ((window & ~(opened[row - 1] | flagged[row - 1])).bit_count()
+                                + (side & ~(opened[row] | flagged[row])).bit_count()
+                                + (window & ~(opened[row + 1] | flagged[row + 1])).bit_count())
+                if not hidden_count:
+                    continue
+
+                cell_value = numbers[offset + c]
+                if cell_value == flagged_count + hidden_count:
+                    for (nr, nc) in self.neighbor_state(row - ROW_PAD, c)[0]:
+                        self.flag_cell(nr, nc)
+                    change_made_in_step = True
+                elif cell_value == flagged_count:
+                    for (nr, nc) in self.neighbor_state(row - ROW_PAD, c)[0]:
+                        self.flood_open(nr, nc)
+                    change_made_in_step = True
+
+        self.sweep_row = self.rows + ROW_PAD
+        self.sweep_col = -1
+        instrument.count("cp_passes")
+        instrument.count("cells_scanned", cells_scanned)
+        instrument.count("constraint_checks", constraint_checks)
+
+        if change_made_in_step and not self.game_over:
+            self.use_step()
+
+        return change_made_in_step
+
+
+# Phase timers, bound only when instrumentation is enabled
+instrument.register_phases(BitboardEngine, {"cp_solver_step": "cp", "flood_open": "flood"})
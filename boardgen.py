@@ -0,0 +1,48 @@
+# NumPy is optional: without it HAS_NUMPY is False and callers fall back to
+# the pure-Python loops in engine.py
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HAS_NUMPY = np is not None
+
+# Offsets of the 8 neighbors of a cell
+NEIGHBOR_OFFSETS = [(i, j) for i in range(-1, 2) for j in range(-1, 2) if i != 0 or j != 0]
+
+
+def neighbor_counts(mines):
+    """Returns board_logic values for a (..., H, W) boolean mine array.
+
+    Each cell holds its number of neighboring mines, or -1 for a mine, as int8.
+    The counts are one shifted sum over a zero-padded copy of the mine array.
+    """
+    mines = np.asarray(mines, dtype=bool)
+    rows, cols = mines.shape[-2:]
+    pad_width = [(0, 0)] * (mines.ndim - 2) + [(1, 1), (1, 1)]
+    padded = np.pad(mines.view(np.int8), pad_width)
+
+    counts = np.zeros(mines.shape, dtype=np.int8)
+    for i, j in NEIGHBOR_OFFSETS:
+        counts += padded[..., 1 + i:1 + i + rows, 1 + j:1 + j + cols]
+    counts[mines] = -1
+    return counts
+
+
+def place_mines(count, rows, cols, bomb_count, rng):
+    """Returns a (count, rows, cols) boolean array with bomb_count distinct mines per board."""
+    cells = rows * cols
+    bomb_count = min(bomb_count, cells)
+    mines = np.zeros((count, cells), dtype=bool)
+    if bomb_count > 0:
+        # The bomb_count smallest of a row of random keys are a uniform sample of cells
+        keys = rng.random((count, cells))
+        mine_cells = np.argpartition(keys, bomb_count - 1, axis=1)[:, :bomb_count]
+        np.put_along_axis(mines, mine_cells, True, axis=1)
+    return mines.reshape(count, rows, cols)
+
+
+def generate_boards(count, rows, cols, bomb_count, seed=None):
+    """Generates count boards at once as a (count, rows, cols) int8 board_logic array."""
+    rng = np.random.default_rng(seed)
+    return neighbor_counts(place_mines(count, rows, cols, bomb_count, rng))
@@ -0,0 +1,169 @@
+import argparse
+import csv
+import json
+import os
+import sys
+
+from batch import (EARLY_STOP_MAX_GAMES, add_outcome, format_summary, iter_comparison, iter_outcomes,
+                   iter_until_precise, new_counts)
+from corpus import BoardCorpus
+from engine import BOARD_SIZE, DEFAULT_BOMB_COUNT, STEP_LIMIT, SOLVER_TYPES
+from stats import (DECISION_A, DECISION_B, DECISION_EQUAL, DEFAULT_CONFIDENCE, DEFAULT_INTERVAL, INTERVALS,
+                   SequentialComparison)
+
+# Games played when neither --games nor an early-stopping option is given
+DEFAULT_GAMES = 1000
+
+# Per-game output formats; every format writes one line per game, in game order
+OUTPUT_FORMATS = ["text", "csv", "jsonl"]
+
+
+class ResultWriter:
+    """Writes one line per finished game and flushes it, so a run can be followed through a pipe."""
+
+    def __init__(self, out, output_format, columns):
+        self.out = out
+        self.output_format = output_format
+        self.columns = columns
+        self.csv = None
+        if output_format == "csv":
+            self.csv = csv.writer(out)
+            self.csv.writerow(columns)
+
+    def write(self, *values):
+        if self.output_format == "csv":
+            self.csv.writerow(values)
+        elif self.output_format == "jsonl":
+            self.out.write(json.dumps(dict(zip(self.columns, values))) + "\n")
+        else:
+            self.out.write(" ".join(str(value) for value in values) + "\n")
+        self.out.flush()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Play a seeded batch of games without a display and stream one result per game.")
+    parser.add_argument("--size", type=int, default=BOARD_SIZE, help="rows and columns of a square board")
+    parser.add_argument("--width", type=int, help="columns; overrides --size")
+    parser.add_argument("--height", type=int, help="rows; overrides --size")
+    parser.add_argument("--mines", type=int, default=DEFAULT_BOMB_COUNT)
+    parser.add_argument("--step-limit", type=int, default=STEP_LIMIT)
+    parser.add_argument("--solver", choices=SOLVER_TYPES, default="CSP")
+    parser.add_argument("--games", type=int,
+                        help=f"games to play, or the most to play with --precision / --against "
+                             f"(default: {DEFAULT_GAMES}, or {EARLY_STOP_MAX_GAMES} when stopping early; "
+                             f"at most the boards in --corpus)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--seed", type=int, default=0, help="master seed; game i is dealt from (seed, i)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="text", dest="output_format")
+    parser.add_argument("--output", help="write the per-game results here instead of stdout")
+    parser.add_argument("--bitboard", action="store_true", help="play with BitboardEngine")
+    parser.add_argument("--corpus", help="play board i of this corpus file as game i")
+    parser.add_argument("--safe-first-click", action="store_true",
+                        help="plant the mines only after the first click, away from it")
+    parser.add_argument("--precision", type=float, metavar="HALF_WIDTH",
+                        help="stop once the win-rate interval is at most +-HALF_WIDTH, e.g. 0.02")
+    parser.add_argument("--interval", choices=list(INTERVALS), default=DEFAULT_INTERVAL)
+    parser.add_argument("--confidence", type=float, default=DEFAULT_CONFIDENCE)
+    parser.add_argument("--against", choices=SOLVER_TYPES, metavar="SOLVER",
+                        help="play SOLVER on the same boards and stop once a sequential test tells them apart")
+    parser.add_argument("--quiet", action="store_true", help="do not print the summary to stderr")
+    args = parser.parse_args(argv)
+
+    args.rows = args.height if args.height is not None else args.size
+    args.cols = args.width if args.width is not None else args.size
+    games_given = args.games is not None
+    if not games_given:
+        early_stop = args.precision is not None or args.against is not None
+        args.games = EARLY_STOP_MAX_GAMES if early_stop else DEFAULT_GAMES
+    if args.corpus is None:
+        if args.rows < 2 or args.cols < 2:
+            parser.error("the board must be at least 2x2")
+        if not 1 <= args.mines < args.rows * args.cols:
+            parser.error("--mines must be at least 1 and fewer than the number of cells")
+    else:
+        with BoardCorpus(args.corpus) as corpus:
+            args.rows, args.cols, args.mines = corpus.rows, corpus.cols, corpus.bomb_count
+            if games_given and args.games > len(corpus):
+                parser.error(f"the corpus only holds {len(corpus)} boards")
+            # Without --games, play (or stop early within) the whole corpus at most
+            args.games = min(args.games, len(corpus))
+    if args.precision is not None and args.against is not None:
+        parser.error("--precision and --against cannot be combined")
+    if not 0 < args.confidence < 1:
+        parser.error("--confidence must be between 0 and 1")
+    if args.games < 1:
+        parser.error("--games must be at least 1")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.step_limit < 1:
+        parser.error("--step-limit must be at least 1")
+    if args.corpus is not None and args.safe_first_click:
+        parser.error("--safe-first-click cannot be used with --corpus, whose mines are already placed")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    out = open(args.output, "w", newline="") if args.output else sys.stdout
+    batch_args = (args.games, args.workers, args.seed, args.rows, args.mines, args.step_limit, args.bitboard,
+                  args.corpus, args.safe_first_click, args.cols)
+
+    if args.against is not None:
+        comparison = SequentialComparison()
+        results = iter_comparison(args.solver, args.against, comparison, *batch_args)
+        writer = ResultWriter(out, args.output_format, ["game", args.solver, args.against])
+        solvers = [args.solver, args.against]
+    elif args.precision is not None:
+        results = iter_until_precise(args.solver, args.precision, *batch_args, args.interval, args.confidence)
+        writer = ResultWriter(out, args.output_format, ["game", "outcome"])
+        solvers = [args.solver]
+    else:
+        results = iter_outcomes(args.solver, *batch_args)
+        writer = ResultWriter(out, args.output_format, ["game", "outcome"])
+        solvers = [args.solver]
+
+    counts = [new_counts() for _ in solvers]
+    stopped = False
+    try:
+        for game_index, *outcomes in results:
+            writer.write(game_index, *outcomes)
+            for solver_counts, outcome in zip(counts, outcomes):
+                add_outcome(solver_counts, outcome)
+    except KeyboardInterrupt:
+        stopped = True
+    except BrokenPipeError:
+        # The reader went away (e.g. piped into head); point stdout at devnull so exiting does not fail again
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    finally:
+        results.close()
+        if out is not sys.stdout:
+            out.close()
+
+    if not args.quiet and counts[0]["games"]:
+        for solver, solver_counts in zip(solvers, counts):
+            print(format_summary(solver, args.mines, solver_counts, stopped=stopped, master_seed=args.seed,
+                                 method=args.interval, confidence=args.confidence), file=sys.stderr)
+            print(file=sys.stderr)
+        if args.against is not None:
+            print(comparison_verdict(comparison, args.solver, args.against), file=sys.stderr)
+    return 130 if stopped else 0
+
+
+def comparison_verdict(comparison, solver_a, solver_b):
+    decision = comparison.decision()
+    detail = (f"{comparison.a_only} boards only {solver_a} won, {comparison.b_only} only {solver_b} won, "
+              f"out of {comparison.games}")
+    if decision == DECISION_A:
+        return f"{solver_a} wins more boards than {solver_b} ({detail})"
+    if decision == DECISION_B:
+        return f"{solver_b} wins more boards than {solver_a} ({detail})"
+    if decision == DECISION_EQUAL:
+        return (f"No win-rate difference of {comparison.delta:.0%} or more between {solver_a} "
+                f"and {solver_b} ({detail})")
+    return f"Undecided after {comparison.games} boards ({detail})"
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+import argparse
+import mmap
+import struct
+import sys
+
+from engine import game_rng, sample_cells
+
+# File layout: a fixed header, then one packed mine bitmap per board. Bit
+# r * cols + c of a board (little-endian, bit 0 of byte 0 first) is set when
+# (r, c) is a mine, and every bitmap takes the same number of bytes.
+CORPUS_MAGIC = b"MSWC"
+CORPUS_VERSION = 1
+HEADER_FORMAT = "<4sHHIIIQ"
+HEADER_SIZE = 32
+
+# Boards generated per write() call
+WRITE_CHUNK = 4096
+
+
+def board_stride(rows, cols):
+    return (rows * cols + 7) // 8
+
+
+def seeded_mine_bits(rows, cols, bomb_count, master_seed, board_index):
+    """Returns board board_index of a seeded corpus as a mine bitmask int.
+
+    The bombs are the ones MinesweeperEngine.new_game plants with game_rng(master_seed, board_index).
+    """
+    bits = 0
+    for index in sample_cells(game_rng(master_seed, board_index), rows * cols, bomb_count):
+        bits |= 1 << index
+    return bits
+
+
+def write_corpus(path, count, rows, cols, bomb_count, master_seed=0):
+    """Generates count seeded boards and writes them as a corpus file.
+
+    Board i depends only on (master_seed, i), so any slice of a corpus can be
+    regenerated on its own.
+    """
+    stride = board_stride(rows, cols)
+    with open(path, "wb") as f:
+        header = struct.pack(HEADER_FORMAT, CORPUS_MAGIC, CORPUS_VERSION, HEADER_SIZE,
+                             rows, cols, bomb_count, count)
+        f.write(header.ljust(HEADER_SIZE, b"\0"))
+        for start in range(0, count, WRITE_CHUNK):
+            chunk = bytearray()
+            for board_index in range(start, min(start + WRITE_CHUNK, count)):
+                bits = seeded_mine_bits(rows, cols, bomb_count, master_seed, board_index)
+                chunk += bits.to_bytes(stride, "little")
+            f.write(chunk)
+
+
+class BoardCorpus:
+    """Read-only, memory-mapped view of a corpus file.
+
+    board_bytes(i) is a memoryview straight into the mapping, so reading a
+    board neither parses nor copies the file; worker processes that open the
+    same corpus share its pages through the OS cache. close() raises
+    BufferError while any such view is still alive, and leaves the corpus
+    open, so it can be called again once the views are released.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, header_size, rows, cols, bomb_count, count = \
+            struct.unpack_from(HEADER_FORMAT, self.map)
+        if magic != CORPUS_MAGIC or version != CORPUS_VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {CORPUS_VERSION} board corpus")
+        self.header_size = header_size
+        self.rows = rows
+        self.cols = cols
+        self.bomb_count = bomb_count
+        self.count = count
+        self.stride = board_stride(rows, cols)
+        if len(self.map) < header_size + count * self.stride:
+            self.close()
+            raise ValueError(f"{path} is truncated")
+
+    def __len__(self):
+        return self.count
+
+    def board_bytes(self, index):
+        """Returns board index as a memoryview into the mapping.
+
+        Release the view (view.release(), or use it in a with block) before
+        closing the corpus.
+        """
+        if not 0 <= index < self.count:
+            raise IndexError(f"board {index} out of range for a corpus of {self.count}")
+        start = self.header_size + index * self.stride
+        with memoryview(self.map) as view:
+            return view[start:start + self.stride]
+
+    def mine_bits(self, index):
+        """Returns board index as an int with bit r * cols + c set for every mine."""
+        with self.board_bytes(index) as view:
+            return int.from_bytes(view, "little")
+
+    def load(self, engine, index):
+        """Starts a new game on engine with the mines of board index."""
+        engine.load_mine_bits(self.mine_bits(index), self.rows, self.cols)
+
+    def close(self):
+        # The only step that can fail, so a failed close changes nothing
+        self.map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a seeded board corpus.")
+    parser.add_argument("path")
+    parser.add_argument("--count", type=int, required=True)
+    parser.add_argument("--rows", type=int, required=True)
+    parser.add_argument("--cols", type=int)
+    parser.add_argument("--mines", type=int, required=True)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    cols = args.cols if args.cols is not None else args.rows
+    write_corpus(args.path, args.count, args.rows, cols, args.mines, args.seed)
+    print(f"Wrote {args.count} {args.rows}x{cols} boards with {args.mines} mines to {args.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,263 @@
+# Search nodes one component may use before it is left unsolved
+COMPONENT_NODE_LIMIT = 200000
+
+
+class SearchLimitExceeded(Exception):
+    """Raised when a component needs more than its node budget."""
+
+
+def frontier_constraints(engine, frontier_cells):
+    """Returns one (cells, mines) constraint per opened number next to the frontier.
+
+    cells are the number's hidden neighbors and mines is its value minus the
+    flags already around it.
+    """
+    constraints = []
+    seen_numbers = set()
+    board_status = engine.board_status
+    board_logic = engine.board_logic
+    for (r, c) in frontier_cells:
+        for (nr, nc) in engine.neighbor_cells(r, c):
+            if (nr, nc) in seen_numbers:
+                continue
+            if board_status[nr][nc] != 'O' or board_logic[nr][nc] <= 0:
+                continue
+            seen_numbers.add((nr, nc))
+            hidden_neighbors, flagged_neighbors_count = engine.neighbor_state(nr, nc)
+            constraints.append((tuple(hidden_neighbors), board_logic[nr][nc] - flagged_neighbors_count))
+    return constraints
+
+
+def split_components(constraints):
+    """Groups constraints into independent components that share no hidden cell.
+
+    Returns a list of (cells, constraints) pairs.
+    """
+    parent = {}
+
+    def find(cell):
+        root = cell
+        while parent[root] != root:
+            root = parent[root]
+        while parent[cell] != root:
+            parent[cell], cell = root, parent[cell]
+        return root
+
+    for cells, _ in constraints:
+        for cell in cells:
+            parent.setdefault(cell, cell)
+        first = find(cells[0])
+        for cell in cells[1:]:
+            root = find(cell)
+            if root != first:
+                parent[root] = first
+
+    components = {}
+    for constraint in constraints:
+        root = find(constraint[0][0])
+        components.setdefault(root, ([], []))[1].append(constraint)
+    for cell in parent:
+        components[find(cell)][0].append(cell)
+    return list(components.values())
+
+
+def solve_component(cells, constraints, node_limit=COMPONENT_NODE_LIMIT, fixed=None, first_only=False):
+    """Enumerates every mine assignment of one component that meets all its constraints.
+
+    Returns (solution_counts, mine_counts): solution_counts[k] is the number of
+    solutions with k mines and mine_counts[k][i] how many of those put a mine on
+    cells[i]. Raises SearchLimitExceeded past node_limit search nodes. fixed
+    maps cells to a value (1 for a mine) every solution must give them, and
+    first_only stops at the first solution found.
+    """
+    index = {cell: i for i, cell in enumerate(cells)}
+    n_cells = len(cells)
+
+    # Per constraint: its variables and how many of them must be mines
+    constraint_vars = [[index[cell] for cell in con_cells] for con_cells, _ in constraints]
+    needs = [mines for _, mines in constraints]
+    var_constraints = [[] for _ in range(n_cells)]
+    for ci, variables in enumerate(constraint_vars):
+        for v in variables:
+            var_constraints[v].append(ci)
+
+    assignment = [None] * n_cells
+    mines_set = [0] * len(constraints)
+    unassigned = [len(variables) for variables in constraint_vars]
+    solution_counts = {}
+    mine_counts = {}
+
+    for ci, need in enumerate(needs):
+        if need < 0 or need > unassigned[ci]:
+            return solution_counts, mine_counts
+
+    def assign(v, value):
+        """Sets v and checks its constraints; returns False on a violation."""
+        assignment[v] = value
+        ok = True
+        for ci in var_constraints[v]:
+            unassigned[ci] -= 1
+            mines_set[ci] += value
+            if mines_set[ci] > needs[ci] or mines_set[ci] + unassigned[ci] < needs[ci]:
+                ok = False
+        return ok
+
+    def unassign(v):
+        value = assignment[v]
+        assignment[v] = None
+        for ci in var_constraints[v]:
+            unassigned[ci] += 1
+            mines_set[ci] -= value
+
+    mine_total = 0
+    for cell, value in (fixed or {}).items():
+        if not assign(index[cell], value):
+            return solution_counts, mine_counts
+        mine_total += value
+
+    # Assign cells in an order that keeps constraints closing early
+    order = [v for v in _search_order(n_cells, constraint_vars, var_constraints) if assignment[v] is None]
+
+    # Iterative depth-first search; tried[d] is the next value to try at depth d
+    tried = [0] * len(order)
+    depth = 0
+    nodes = 0
+    while depth >= 0:
+        if depth == len(order):
+            solution_counts[mine_total] = solution_counts.get(mine_total, 0) + 1
+            counts = mine_counts.setdefault(mine_total, [0] * n_cells)
+            for v in range(n_cells):
+                counts[v] += assignment[v]
+            if first_only:
+                break
+            depth -= 1
+            continue
+
+        v = order[depth]
+        if assignment[v] is not None:
+            mine_total -= assignment[v]
+            unassign(v)
+
+        value = tried[depth]
+        if value > 1:
+            tried[depth] = 0
+            depth -= 1
+            continue
+        tried[depth] = value + 1
+
+        nodes += 1
+        if nodes > node_limit:
+            raise SearchLimitExceeded()
+
+        if assign(v, value):
+            mine_total += value
+            depth += 1
+        else:
+            unassign(v)
+
+    return solution_counts, mine_counts
+
+
+def _search_order(n_cells, constraint_vars, var_constraints):
+    order = []
+    placed = [False] * n_cells
+    for start in range(n_cells):
+        if placed[start]:
+            continue
+        placed[start] = True
+        queue = [start]
+        for v in queue:
+            order.append(v)
+            for ci in var_constraints[v]:
+                for w in constraint_vars[ci]:
+                    if not placed[w]:
+                        placed[w] = True
+                        queue.append(w)
+    return order
+
+
+def component_forced_cells(cells, constraints, node_limit=COMPONENT_NODE_LIMIT):
+    """Returns (safe cells, mine cells) of a component too big to enumerate, one cell at a time.
+
+    Each cell is assumed to be a mine, then safe, and only a single solution
+    is searched for; an assumption without one forces the other value. Every
+    solution found also shows values the other cells can take, so those
+    checks are skipped. A check over node_limit nodes leaves its cell
+    undecided.
+    """
+    possible = ({}, {})
+
+    def find_solution(fixed):
+        """Returns True if a solution with fixed exists, None if the search ran over budget."""
+        try:
+            solution_counts, mine_counts = solve_component(cells, constraints, node_limit, fixed, first_only=True)
+        except SearchLimitExceeded:
+            return None
+        if not solution_counts:
+            return False
+        for cell, mine in zip(cells, next(iter(mine_counts.values()))):
+            possible[mine][cell] = True
+        return True
+
+    # Without any solution the constraints contradict each other (e.g. a wrong flag) and nothing is forced
+    if not find_solution({}):
+        return [], []
+
+    safe_cells = []
+    mine_cells = []
+    for cell in cells:
+        if cell not in possible[1] and find_solution({cell: 1}) is False:
+            safe_cells.append(cell)
+        elif cell not in possible[0] and find_solution({cell: 0}) is False:
+            mine_cells.append(cell)
+    return safe_cells, mine_cells
+
+
+def solve_frontier(engine, node_limit=COMPONENT_NODE_LIMIT):
+    """Splits the frontier into components and solves each one.
+
+    Returns (solved, unsolved): solved holds (cells, solution_counts,
+    mine_counts) per component and unsolved the (cells, constraints) of the
+    components that ran over node_limit.
+    """
+    solved = []
+    unsolved = []
+    constraints = frontier_constraints(engine, engine.get_frontier_cells())
+    for cells, component_constraints in split_components(constraints):
+        try:
+            solution_counts, mine_counts = solve_component(cells, component_constraints, node_limit)
+        except SearchLimitExceeded:
+            unsolved.append((cells, component_constraints))
+            continue
+        solved.append((cells, solution_counts, mine_counts))
+    return solved, unsolved
+
+
+def forced_moves(engine, node_limit=COMPONENT_NODE_LIMIT, solved=None, unsolved=()):
+    """Solves every frontier component exactly and returns (safe cells, mine cells).
+
+    A cell is safe when no solution of its component puts a mine on it, and a
+    mine when every solution does. Components over node_limit are checked one
+    cell at a time instead (component_forced_cells). solved and unsolved may
+    pass in components already returned by solve_frontier.
+    """
+    if solved is None:
+        solved, unsolved = solve_frontier(engine, node_limit)
+
+    safe_cells = []
+    mine_cells = []
+    for cells, solution_counts, mine_counts in solved:
+        total_solutions = sum(solution_counts.values())
+        if total_solutions == 0:
+            continue
+        for i, cell in enumerate(cells):
+            mines = sum(counts[i] for counts in mine_counts.values())
+            if mines == 0:
+                safe_cells.append(cell)
+            elif mines == total_solutions:
+                mine_cells.append(cell)
+    for cells, constraints in unsolved:
+        component_safe, component_mines = component_forced_cells(cells, constraints, node_limit)
+        safe_cells.extend(component_safe)
+        mine_cells.extend(component_mines)
+    return safe_cells, mine_cells
@@ -0,0 +1,727 @@
+import heapq
+import random
+
+import instrument
+from boardgen import HAS_NUMPY, NEIGHBOR_OFFSETS, neighbor_counts
+from csp import forced_moves
+from gauss import FrontierEquations
+from patterns import (OFFSET_BITS, PATTERNS_PER_VALUE, STATE_FLAGGED, STATE_HIDDEN,
+                      STATE_WEIGHTS, pattern_table)
+from probability import probability_step_moves
+from sat import FrontierSat
+
+# Board Config
+BOARD_SIZE = 15
+DEFAULT_BOMB_COUNT = 30
+STEP_LIMIT = 20
+
+# Game results
+RESULT_WIN = "win"
+RESULT_BOMB = "bomb"
+RESULT_STEPS = "steps"
+
+# Auto run outcomes
+OUTCOME_WIN = "win"
+OUTCOME_LOSS = "loss"
+OUTCOME_STUCK = "stuck"
+
+# CSP backends tried when CP finds nothing, by solver type
+CSP_SOLVER_STEPS = {
+    "CSP": "csp_solver_1ply_step",
+    "BATCH": "csp_solver_1ply_batch_step",
+    "EXACT": "csp_exact_step",
+    "PROB": "csp_probability_step",
+    "SAT": "csp_sat_step",
+    "GAUSS": "csp_gauss_step",
+}
+SOLVER_TYPES = ["CP"] + list(CSP_SOLVER_STEPS)
+
+
+def game_rng(master_seed, game_index):
+    """Returns the RNG stream for one game of a seeded batch.
+
+    Each game gets its own stream derived from (master_seed, game_index), so the
+    boards do not depend on which worker plays them or in what order.
+    """
+    return random.Random(f"{master_seed}:{game_index}")
+
+
+def play_rng(master_seed, game_index):
+    """Returns the RNG stream the solver plays game game_index of a seeded batch with.
+
+    It is separate from the game_rng stream that deals the board, so the
+    solver's first click and guesses never reuse the numbers the mines were
+    placed with, and a board can be played without replaying its deal.
+    """
+    return random.Random(f"{master_seed}:{game_index}:play")
+
+
+def sample_cells(rng, cell_count, count, excluded=()):
+    """Returns min(count, allowed) distinct indices of range(cell_count) outside excluded.
+
+    A partial Fisher-Yates shuffle over a virtual array of the allowed cells,
+    with the swapped slots kept in a dict: O(count + len(excluded)) time and
+    memory however dense the board is.
+    """
+    excluded = set(excluded)
+    allowed = cell_count - len(excluded)
+    count = min(count, allowed)
+
+    # Slot p < allowed holds cell p, except that excluded cells there are
+    # replaced by the allowed cells at or past the end of the virtual array
+    tail = (index for index in range(allowed, cell_count) if index not in excluded)
+    remap = {index: next(tail) for index in sorted(excluded) if index < allowed}
+
+    swapped = {}
+    picked = []
+    for i in range(count):
+        j = rng.randrange(i, allowed)
+        slot = swapped.get(j, j)
+        swapped[j] = swapped.get(i, i)
+        picked.append(remap.get(slot, slot))
+    return picked
+
+
+# Minesweeper Engine
+class MinesweeperEngine:
+    """Headless Minesweeper board, rules and solvers (no tkinter)."""
+
+    def __init__(self, board_size=BOARD_SIZE, bomb_count=DEFAULT_BOMB_COUNT,
+                 step_limit=STEP_LIMIT, rng=None, cols=None, safe_first_click=False):
+        """Creates an engine and deals the first board.
+
+        board_size is the number of rows; cols defaults to board_size for a square board.
+        With safe_first_click, bombs are only planted at the first click, away from
+        the clicked cell and its neighbors.
+        """
+        self.rows = board_size
+        self.cols = cols if cols is not None else board_size
+        self.bomb_count = bomb_count
+        self.step_limit = step_limit
+        self.rng = rng if rng is not None else random
+        self.safe_first_click = safe_first_click
+
+        # 1-ply CSP deductions come from the 3x3 pattern table; verify re-checks
+        # every table answer against check_immediate_contradiction
+        self.use_pattern_table = True
+        self.verify_pattern_table = False
+        self.new_game()
+
+    def new_game(self):
+        """Resets the game state and plants a fresh set of bombs, or defers that to the first click."""
+        instrument.start_game()
+        self.reset_state()
+        self.allocate_board()
+        self.mine_indices = []
+        self.deal_pending = self.safe_first_click
+        if not self.deal_pending:
+            self.deal()
+
+    def deal(self, first_click=None):
+        """Plants the bombs; none lands on first_click or, if there is room, next to it."""
+        cell_count = self.rows * self.cols
+        excluded = []
+        if first_click is not None:
+            zone = [first_click] + self.neighbor_cells(*first_click)
+            if self.bomb_count > cell_count - len(zone):
+                zone = [first_click]
+            excluded = [r * self.cols + c for (r, c) in zone]
+
+        self.mine_indices = sample_cells(self.rng, cell_count, self.bomb_count, excluded)
+        self.bomb_count = len(self.mine_indices)
+        for index in self.mine_indices:
+            r, c = divmod(index, self.cols)
+            self.board_logic[r][c] = -1
+
+        self.calculate_neighbor_numbers()
+        self.deal_pending = False
+
+    def load_board(self, board_logic):
+        """Starts a new game on a prebuilt board, e.g. one slice of boardgen.generate_boards."""
+        if hasattr(board_logic, "tolist"):
+            board_logic = board_logic.tolist()
+        self.rows = len(board_logic)
+        self.cols = len(board_logic[0])
+        self.bomb_count = sum(row.count(-1) for row in board_logic)
+        instrument.start_game()
+        self.reset_state()
+        self.allocate_board()
+        self.fill_board(board_logic)
+        self.mine_indices = [r * self.cols + c for r, row in enumerate(board_logic)
+                             for c, value in enumerate(row) if value == -1]
+        self.deal_pending = False
+
+    def load_mine_bits(self, mine_bits, rows, cols):
+        """Starts a new game with a bomb on every cell whose bit r * cols + c is set, e.g. a corpus board."""
+        self.rows = rows
+        self.cols = cols
+        instrument.start_game()
+        self.reset_state()
+        self.allocate_board()
+        self.plant_mine_bits(mine_bits)
+        self.calculate_neighbor_numbers()
+        self.deal_pending = False
+
+    def plant_mine_bits(self, mine_bits):
+        full_row = (1 << self.cols) - 1
+        self.mine_indices = []
+        for r in range(self.rows):
+            row_bits = (mine_bits >> (r * self.cols)) & full_row
+            while row_bits:
+                low = row_bits & -row_bits
+                c = low.bit_length() - 1
+                self.board_logic[r][c] = -1
+                self.mine_indices.append(r * self.cols + c)
+                row_bits ^= low
+        self.bomb_count = len(self.mine_indices)
+
+    def reset_state(self):
+        self.steps_left = self.step_limit
+        self.game_over = False
+        self.result = None
+        self.exploded_cell = None
+        self.bombs_flagged = 0
+        self.cells_opened = 0
+        self.changed_cells = []
+
+        # Hidden cells next to an opened number, kept up to date by cell_changed
+        self.frontier = set()
+
+        # Incremental SAT encoding and linear system of this game, created by their first step
+        self.sat_frontier = None
+        self.gauss_frontier = None
+
+        # CP worklist: opened number cells whose neighborhood changed since they were last checked
+        self.dirty_cells = set()
+        self.sweep_heap = []
+        self.sweep_position = self.rows * self.cols
+
+    def allocate_board(self):
+        """Creates an empty, fully hidden board_logic / board_status pair."""
+        self.board_logic = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
+        self.board_status = [['H' for _ in range(self.cols)] for _ in range(self.rows)]
+
+    def fill_board(self, board_logic):
+        self.board_logic = [list(row) for row in board_logic]
+
+    def calculate_neighbor_numbers(self):
+        if HAS_NUMPY:
+            self.board_logic = neighbor_counts([[value == -1 for value in row]
+                                                for row in self.board_logic]).tolist()
+            return
+
+        for r in range(self.rows):
+            for c in range(self.cols):
+                if self.board_logic[r][c] == -1:
+                    continue
+
+                bomb_neighbors_count = 0
+                for i in range(-1, 2):
+                    for j in range(-1, 2):
+                        if i == 0 and j == 0:
+                            continue
+                        neighbor_r, neighbor_c = r + i, c + j
+                        if 0 <= neighbor_r < self.rows and 0 <= neighbor_c < self.cols and \
+                           self.board_logic[neighbor_r][neighbor_c] == -1:
+                            bomb_neighbors_count += 1
+                self.board_logic[r][c] = bomb_neighbors_count
+
+    # Neighbor accessors
+
+    def neighbor_cells(self, r, c):
+        """Returns the on-board neighbors of (r, c)."""
+        cells = []
+        for i in range(-1, 2):
+            for j in range(-1, 2):
+                if i == 0 and j == 0:
+                    continue
+                nr, nc = r + i, c + j
+                if 0 <= nr < self.rows and 0 <= nc < self.cols:
+                    cells.append((nr, nc))
+        return cells
+
+    def neighbor_state(self, r, c):
+        """Returns (hidden neighbors of (r, c), number of flagged neighbors)."""
+        hidden_neighbors = []
+        flagged_neighbors_count = 0
+        for i in range(-1, 2):
+            for j in range(-1, 2):
+                if i == 0 and j == 0: continue
+                nr, nc = r + i, c + j
+                if 0 <= nr < self.rows and 0 <= nc < self.cols:
+                    if self.board_status[nr][nc] == 'H':
+                        hidden_neighbors.append((nr, nc))
+                    elif self.board_status[nr][nc] == 'F':
+                        flagged_neighbors_count += 1
+        return hidden_neighbors, flagged_neighbors_count
+
+    def neighbor_counts(self, r, c):
+        """Returns (hidden neighbor count, flagged neighbor count) of (r, c)."""
+        hidden_neighbors, flagged_neighbors_count = self.neighbor_state(r, c)
+        return len(hidden_neighbors), flagged_neighbors_count
+
+    def cell_changed(self, r, c):
+        """Records a status change of (r, c) for the view, the frontier and the CP worklist."""
+        self.changed_cells.append((r, c))
+        self.update_frontier(r, c)
+
+        # (r, c) and its neighbors are re-checked; cp_solver_step skips the non-numbers
+        cols = self.cols
+        c0 = c - 1 if c > 0 else 0
+        c1 = c + 2 if c + 2 < cols else cols
+        position = self.sweep_position
+        for nr in range(r - 1 if r > 0 else 0, r + 2 if r + 2 < self.rows else self.rows):
+            first = nr * cols + c0
+            last = nr * cols + c1
+            if last <= position + 1:
+                self.dirty_cells.update(range(first, last))
+                continue
+            # Cells still ahead of the running sweep are checked in this sweep
+            for index in range(first, last):
+                if index > position:
+                    heapq.heappush(self.sweep_heap, index)
+                else:
+                    self.dirty_cells.add(index)
+
+    def update_frontier(self, r, c):
+        """Brings the frontier set up to date after the status of (r, c) changed."""
+        status = self.board_status[r][c]
+        if status == 'O':
+            self.frontier.discard((r, c))
+            if self.board_logic[r][c] > 0:
+                self.frontier.update(self.neighbor_state(r, c)[0])
+        elif status == 'F':
+            self.frontier.discard((r, c))
+        else:
+            # Unflagged: back on the frontier if it touches an opened number
+            for (nr, nc) in self.neighbor_cells(r, c):
+                if self.board_status[nr][nc] == 'O' and self.board_logic[nr][nc] > 0:
+                    self.frontier.add((r, c))
+                    break
+
+    def drain_changed_cells(self):
+        """Returns the cells whose status changed since the last call."""
+        changed = self.changed_cells
+        self.changed_cells = []
+        return changed
+
+    def end_game(self, result):
+        self.game_over = True
+        self.result = result
+
+    def use_step(self, count=1):
+        """Spends steps; running out ends the game."""
+        if self.game_over:
+            return
+
+        self.steps_left -= count
+        if self.steps_left <= 0 and count > 0:
+            self.end_game(RESULT_STEPS)
+
+    def open_cell(self, r, c):
+        """Player click: spends a step and opens (r, c)."""
+        if self.game_over or self.board_status[r][c] != 'H':
+            return
+
+        if self.deal_pending:
+            self.deal(first_click=(r, c))
+        self.use_step()
+
+        if self.board_logic[r][c] == -1:
+            self.exploded_cell = (r, c)
+            self.cell_changed(r, c)
+            self.end_game(RESULT_BOMB)
+        else:
+            self.flood_open(r, c)
+            self.check_win_condition()
+
+    def toggle_flag(self, r, c):
+        """Player right click: flags or unflags a hidden cell."""
+        if self.game_over:
+            return
+
+        if self.board_status[r][c] == 'H':
+            self.flag_cell(r, c)
+        elif self.board_status[r][c] == 'F':
+            self.board_status[r][c] = 'H'
+            self.cell_changed(r, c)
+            self.bombs_flagged -= 1
+
+    def flag_cell(self, r, c):
+        self.board_status[r][c] = 'F'
+        self.cell_changed(r, c)
+        self.bombs_flagged += 1
+
+    def flood_open(self, r, c):
+        """Opens (r, c) and, through zero cells, the whole region around it.
+
+        Uses an explicit stack instead of recursion, so the size of the region is
+        not bounded by the interpreter's recursion limit. Returns the opened cells.
+        """
+        if not (0 <= r < self.rows and 0 <= c < self.cols):
+            return []
+        board_status = self.board_status
+        if board_status[r][c] != 'H':
+            return []
+
+        board_logic = self.board_logic
+        rows, cols = self.rows, self.cols
+        opened = []
+        board_status[r][c] = 'O'
+        stack = [(r, c)]
+        while stack:
+            r, c = stack.pop()
+            opened.append((r, c))
+            self.cell_changed(r, c)
+            if board_logic[r][c] != 0:
+                continue
+
+            c0 = c - 1 if c > 0 else 0
+            c1 = c + 2 if c + 2 < cols else cols
+            for nr in range(r - 1 if r > 0 else 0, r + 2 if r + 2 < rows else rows):
+                status_row = board_status[nr]
+                for nc in range(c0, c1):
+                    if status_row[nc] == 'H':
+                        status_row[nc] = 'O'
+                        stack.append((nr, nc))
+
+        self.cells_opened += len(opened)
+        return opened
+
+    def check_win_condition(self):
+        if self.game_over:
+            return
+
+        if self.cells_opened == (self.rows * self.cols) - self.bomb_count:
+            self.end_game(RESULT_WIN)
+
+    # CP Solver
+
+    def first_safe_click(self):
+        """Opens a random non-bomb cell to start a solver run."""
+        cell_count = self.rows * self.cols
+        if self.deal_pending:
+            index = self.rng.randrange(cell_count)
+            self.deal(first_click=divmod(index, self.cols))
+        else:
+            safe_count = cell_count - len(self.mine_indices)
+            if safe_count <= 0:
+                return
+            # The k-th non-bomb cell: step over every bomb at or before it
+            index = self.rng.randrange(safe_count)
+            for mine in sorted(self.mine_indices):
+                if mine > index:
+                    break
+                index += 1
+
+        self.safe_ai_click(*divmod(index, self.cols))
+        self.use_step()
+
+    def cp_solver_step(self):
+        """One CP sweep over the dirty number cells, in row-major order.
+
+        A number cell whose neighborhood has not changed since it was last
+        checked cannot yield a new move, so only the worklist is visited. Cells
+        dirtied ahead of the sweep position join the running sweep, which makes
+        every sweep equivalent to a full-board rescan.
+        """
+        if self.game_over:
+            return False
+
+        change_made_in_step = False
+        cells_scanned = 0
+        constraint_checks = 0
+
+        self.sweep_heap = sorted(self.dirty_cells)
+        self.dirty_cells = set()
+        last_index = -1
+        while self.sweep_heap:
+            index = heapq.heappop(self.sweep_heap)
+            if index == last_index:
+                continue
+            last_index = index
+            self.sweep_position = index
+            cells_scanned += 1
+
+            r, c = divmod(index, self.cols)
+            cell_value = self.board_logic[r][c]
+            if cell_value <= 0 or self.board_status[r][c] != 'O':
+                continue
+            constraint_checks += 1
+
+            hidden_neighbors, flagged_neighbors_count = self.neighbor_state(r, c)
+
+            if cell_value == (flagged_neighbors_count + len(hidden_neighbors)) and len(hidden_neighbors) > 0:
+                for (nr, nc) in hidden_neighbors:
+                    self.flag_cell(nr, nc)
+                    change_made_in_step = True
+
+            if cell_value == flagged_neighbors_count and len(hidden_neighbors) > 0:
+                for (nr, nc) in hidden_neighbors:
+                    self.flood_open(nr, nc)
+                    change_made_in_step = True
+
+        self.sweep_position = self.rows * self.cols
+        instrument.count("cp_passes")
+        instrument.count("cells_scanned", cells_scanned)
+        instrument.count("constraint_checks", constraint_checks)
+
+        if change_made_in_step and not self.game_over:
+            self.use_step()
+
+        return change_made_in_step
+
+    # CSP Solver
+
+    def csp_solver_1ply_step(self):
+        frontier_cells = self.get_frontier_cells()
+        pattern_codes = {}
+
+        for checked, (r, c) in enumerate(frontier_cells, 1):
+            deduction = self.one_ply_deduction(r, c, pattern_codes)
+
+            if deduction == "mine":
+                self.flag_cell(r, c)
+            elif deduction == "safe":
+                self.safe_ai_click(r, c)
+            else:
+                continue
+
+            instrument.count("constraint_checks", checked)
+            instrument.count("deductions")
+            if not self.game_over:
+                self.use_step()
+            return True
+
+        instrument.count("constraint_checks", len(frontier_cells))
+        return False
+
+    def csp_solver_1ply_batch_step(self):
+        """Applies every 1-ply deduction of the current position together, as one step.
+
+        All deductions are read from the same position before any is applied.
+        Returns how many cells were flagged or opened, 0 if none.
+        """
+        if self.game_over:
+            return 0
+
+        pattern_codes = {}
+        safe_cells = []
+        mine_cells = []
+        frontier_cells = self.get_frontier_cells()
+        instrument.count("constraint_checks", len(frontier_cells))
+        for (r, c) in frontier_cells:
+            deduction = self.one_ply_deduction(r, c, pattern_codes)
+            if deduction == "mine":
+                mine_cells.append((r, c))
+            elif deduction == "safe":
+                safe_cells.append((r, c))
+
+        self.apply_moves(safe_cells, mine_cells)
+        return len(safe_cells) + len(mine_cells)
+
+    def one_ply_deduction(self, r, c, pattern_codes):
+        """Returns "mine", "safe" or None for frontier cell (r, c), honoring the pattern table switches."""
+        if not self.use_pattern_table:
+            return self.contradiction_deduction(r, c)
+
+        deduction = self.pattern_deduction(r, c, pattern_codes)
+        if self.verify_pattern_table:
+            expected = self.contradiction_deduction(r, c)
+            if deduction != expected:
+                raise RuntimeError(f"Pattern table says {deduction} for [{r},{c}], "
+                                   f"contradiction check says {expected}")
+        return deduction
+
+    def contradiction_deduction(self, r, c):
+        """Returns "mine", "safe" or None for hidden (r, c), by assuming each state in turn."""
+        if self.check_immediate_contradiction(r, c, is_assumed_bomb=False):
+            return "mine"
+        if self.check_immediate_contradiction(r, c, is_assumed_bomb=True):
+            return "safe"
+        return None
+
+    def pattern_deduction(self, r, c, pattern_codes):
+        """Same answer as contradiction_deduction, read from the 3x3 pattern table.
+
+        pattern_codes caches the packed neighborhood of each number cell and is
+        only valid while the board does not change.
+        """
+        mine_masks, safe_masks = pattern_table()
+        board_status = self.board_status
+        board_logic = self.board_logic
+        safe = False
+        for (nr, nc) in self.neighbor_cells(r, c):
+            if board_status[nr][nc] != 'O' or board_logic[nr][nc] <= 0:
+                continue
+            code = pattern_codes.get((nr, nc))
+            if code is None:
+                code = pattern_codes[(nr, nc)] = self.neighborhood_code(nr, nc)
+            bit = OFFSET_BITS[(r - nr, c - nc)]
+            if mine_masks[code] & bit:
+                return "mine"
+            if safe_masks[code] & bit:
+                safe = True
+        return "safe" if safe else None
+
+    def neighborhood_code(self, r, c):
+        """Packs the number at (r, c) and its 8 neighbor states into a pattern table index."""
+        board_status = self.board_status
+        code = self.board_logic[r][c] * PATTERNS_PER_VALUE
+        for (i, j), weight in zip(NEIGHBOR_OFFSETS, STATE_WEIGHTS):
+            nr, nc = r + i, c + j
+            if 0 <= nr < self.rows and 0 <= nc < self.cols:
+                status = board_status[nr][nc]
+                if status == 'H':
+                    code += STATE_HIDDEN * weight
+                elif status == 'F':
+                    code += STATE_FLAGGED * weight
+        return code
+
+    def csp_exact_step(self):
+        """Applies every move the exact frontier CSP proves, as one step."""
+        if self.game_over:
+            return False
+
+        safe_cells, mine_cells = forced_moves(self)
+        return self.apply_moves(safe_cells, mine_cells)
+
+    def csp_probability_step(self):
+        """Like csp_exact_step, but when nothing is forced opens the cell least likely to be a bomb."""
+        if self.game_over:
+            return False
+
+        safe_cells, mine_cells, guess = probability_step_moves(self)
+        if guess is not None:
+            # A guess is a real click: it spends a step and may hit a bomb
+            self.open_cell(*guess)
+            return True
+        return self.apply_moves(safe_cells, mine_cells)
+
+    def csp_sat_step(self):
+        """Applies every move the incremental SAT backend proves, as one step."""
+        if self.game_over:
+            return False
+
+        if self.sat_frontier is None:
+            self.sat_frontier = FrontierSat()
+        safe_cells, mine_cells = self.sat_frontier.forced_moves(self)
+        return self.apply_moves(safe_cells, mine_cells)
+
+    def csp_gauss_step(self):
+        """Applies every move Gaussian elimination with the bounds rule proves, as one step."""
+        if self.game_over:
+            return False
+
+        if self.gauss_frontier is None:
+            self.gauss_frontier = FrontierEquations()
+        safe_cells, mine_cells = self.gauss_frontier.forced_moves(self)
+        return self.apply_moves(safe_cells, mine_cells)
+
+    def apply_moves(self, safe_cells, mine_cells):
+        """Flags mine_cells and opens safe_cells as one step; returns True if there were any."""
+        if not safe_cells and not mine_cells:
+            return False
+        instrument.count("deductions", len(safe_cells) + len(mine_cells))
+
+        for (r, c) in mine_cells:
+            self.flag_cell(r, c)
+        for (r, c) in safe_cells:
+            self.safe_ai_click(r, c)
+        if not self.game_over:
+            self.use_step()
+        return True
+
+    def csp_step(self, solver_type):
+        """Runs the CSP backend of solver_type once; the result is truthy if it made a move."""
+        instrument.count("csp_passes")
+        instrument.count("frontier_cells", len(self.frontier))
+        return getattr(self, CSP_SOLVER_STEPS[solver_type])()
+
+    def get_frontier_cells(self):
+        """Returns the hidden cells next to an opened number, from the live frontier set."""
+        return list(self.frontier)
+
+    def scan_frontier_cells(self):
+        """Rebuilds the frontier from a full board scan; a reference for the live set."""
+        frontier = set()
+        for r in range(self.rows):
+            for c in range(self.cols):
+                if self.board_status[r][c] == 'O' and self.board_logic[r][c] > 0:
+                    frontier.update(self.neighbor_state(r, c)[0])
+        return frontier
+
+    def check_immediate_contradiction(self, test_r, test_c, is_assumed_bomb):
+        test_status = self.board_status[test_r][test_c]
+
+        for (neighbor_r, neighbor_c) in self.neighbor_cells(test_r, test_c):
+            if not (self.board_status[neighbor_r][neighbor_c] == 'O' and \
+                    self.board_logic[neighbor_r][neighbor_c] > 0):
+                continue
+
+            number_cell_value = self.board_logic[neighbor_r][neighbor_c]
+
+            hidden_count_around_num, flag_count_around_num = self.neighbor_counts(neighbor_r, neighbor_c)
+            if test_status == 'H':
+                hidden_count_around_num -= 1
+            if is_assumed_bomb and test_status != 'F':
+                flag_count_around_num += 1
+
+            if flag_count_around_num > number_cell_value:
+                return True
+
+            if (flag_count_around_num + hidden_count_around_num) < number_cell_value:
+                return True
+
+        return False
+
+    def safe_ai_click(self, r, c):
+        if self.game_over or self.board_status[r][c] != 'H':
+            return
+
+        if self.board_logic[r][c] == -1:
+            print(f"CSP ERROR: Attempted to open a bomb at [{r},{c}]")
+            return
+        else:
+            self.flood_open(r, c)
+
+    # Headless play
+
+    def solve_step(self, solver_type):
+        """Runs one solver sweep; returns True if the board changed."""
+        if self.cp_solver_step():
+            self.check_win_condition()
+            return True
+        if solver_type != "CP" and not self.game_over:
+            if self.csp_step(solver_type):
+                self.check_win_condition()
+                return True
+        return False
+
+    def play(self, solver_type):
+        """Plays the current board to the end and returns its outcome."""
+        if self.cells_opened == 0:
+            self.first_safe_click()
+            self.check_win_condition()
+
+        outcome = None
+        while not self.game_over:
+            if not self.solve_step(solver_type):
+                outcome = OUTCOME_STUCK
+                break
+
+        if outcome is None:
+            outcome = OUTCOME_WIN if self.result == RESULT_WIN else OUTCOME_LOSS
+        instrument.end_game(outcome)
+        return outcome
+
+
+# Phase timers, bound only when instrumentation is enabled
+instrument.register_phases(MinesweeperEngine, {
+    "new_game": "generate",
+    "cp_solver_step": "cp",
+    "csp_step": "csp",
+    "get_frontier_cells": "frontier",
+    "one_ply_deduction": "contradiction",
+    "flood_open": "flood",
+})
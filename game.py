@@ -1,24 +1,56 @@
+import argparse
+import queue
+import random
+import threading
+import time
 import tkinter as tk
 from tkinter import messagebox, ttk
-import random
 
-# Board Config
-BOARD_SIZE = 15
-DEFAULT_BOMB_COUNT = 30
-STEP_LIMIT = 20
+import instrument
+from batch import EARLY_STOP_CHECK_GAMES, EARLY_STOP_MAX_GAMES, add_outcome, format_summary, new_counts
+from pacing import DEFAULT_SCHEDULER, SCHEDULERS
+from stats import precision_reached, wilson_interval
+from engine import (BOARD_SIZE, DEFAULT_BOMB_COUNT, STEP_LIMIT, RESULT_BOMB, RESULT_WIN, CSP_SOLVER_STEPS,
+                    OUTCOME_WIN, OUTCOME_LOSS, OUTCOME_STUCK, MinesweeperEngine, game_rng, play_rng)
 
 # Interface Config
-COLOR_PANEL_BG = "#2C3E8F"      
-COLOR_PANEL_FG = "#FFFFFF"      
-COLOR_BTN_HOVER = "#4A69C6"     
-COLOR_FLAG = "#7B9AF3"          
-COLOR_CELL_HIDDEN = "#DCDCDC"    
-COLOR_CELL_OPEN = "#FFFFFF"     
-COLOR_GAME_BG = "#BDBDBD"       
-
-FONT_CONTROL_BTN = ("Poppins", 11)        
-FONT_STATUS_LABEL = ("Poppins", 12) 
-FONT_CELL_NUMBER = ("Poppins", 10)      
+COLOR_PANEL_BG = "#2C3E8F"
+COLOR_PANEL_FG = "#FFFFFF"
+COLOR_BTN_HOVER = "#4A69C6"
+COLOR_FLAG = "#7B9AF3"
+COLOR_CELL_HIDDEN = "#DCDCDC"
+COLOR_CELL_OPEN = "#FFFFFF"
+COLOR_GAME_BG = "#BDBDBD"
+
+FONT_CONTROL_BTN = ("Poppins", 11)
+FONT_STATUS_LABEL = ("Poppins", 12)
+FONT_CELL_NUMBER = ("Poppins", 10)
+
+# Pixels per cell on the board canvas, including the 1px gap around each cell
+CELL_SIZE = 30
+MAX_VIEW_WIDTH = 900
+MAX_VIEW_HEIGHT = 600
+MAX_BOARD_SIZE = 1000
+
+# How long the animated interactive solvers show a CP and a CSP move
+CP_STEP_DELAY_MS = 500
+CSP_STEP_DELAY_MS = 750
+
+# Games per auto run. The GUI collects the worker's results once per poll, so the
+# board and the stats panel are redrawn at most AUTO_RUN_MAX_FPS times a second.
+AUTO_RUN_GAMES = 1000
+AUTO_RUN_MAX_FPS = 20
+AUTO_RUN_POLL_MS = 1000 // AUTO_RUN_MAX_FPS
+
+# Auto run lengths: a fixed AUTO_RUN_GAMES, or play until the 95% interval of the
+# win rate is at most +- this wide (up to EARLY_STOP_MAX_GAMES games)
+AUTO_RUN_LENGTHS = {"1000x": None, "±5%": 0.05, "±2%": 0.02, "±1%": 0.01}
+
+# Auto run render modes: only every Nth finished game is handed to the GUI (0 = final board only)
+AUTO_RUN_RENDER_MODES = {"Live": 1, "Every 10th": 10, "Every 100th": 100, "Final only": 0}
+
+# Appearance of a hidden cell: (background, text, text color)
+HIDDEN_APPEARANCE = (COLOR_CELL_HIDDEN, "", "black")
 
 NUMBER_COLOR_MAP = {
     1: "#0000FF",
@@ -31,94 +63,156 @@ NUMBER_COLOR_MAP = {
     8: "#808080"
 }
 
-# Minesweeper Model
+# Minesweeper View
 class MinesweeperGUI:
     """Main class for the Minesweeper game application."""
 
-    def __init__(self, root):
+    def __init__(self, root, pace=DEFAULT_SCHEDULER):
         """Initializes the main window and frames."""
         self.root = root
-        self.root.title("Minesweeper CSP vs CP (15x15)")
         self.root.configure(bg=COLOR_PANEL_BG)
+        self.root.update_idletasks = instrument.timed("gui_update", self.root.update_idletasks)
+
+        # Paces the interactive solvers; picked with the Pace dropdown
+        self.pace = pace
+        self.scheduler = SCHEDULERS[pace](root)
 
+        self.board_rows = BOARD_SIZE
+        self.board_cols = BOARD_SIZE
         self.bomb_count = DEFAULT_BOMB_COUNT
-        
+        self.csp_solver_type = "CSP"
+        self.engine = MinesweeperEngine(self.board_rows, self.bomb_count, STEP_LIMIT, cols=self.board_cols)
+        self.root.title(self.window_title())
+
         # Auto run tracking
         self.auto_run_active = False
-        self.auto_run_count = 0
-        self.auto_run_wins = 0
-        self.auto_run_losses = 0
+        self.auto_run_counts = new_counts()
         self.auto_run_solver_type = None
+        self.auto_run_seed = None
+        self.auto_run_queue = None
+        self.auto_run_stop = None
+        self.auto_run_worker = None
+        # Set once a precision target is reached, while the worker winds down
+        self.auto_run_target_reached = False
+        self.auto_run_render_mode = "Live"
+        self.auto_run_length = "1000x"
+        self.auto_run_precision = None
+        self.auto_run_max_games = AUTO_RUN_GAMES
+        self.auto_run_started = None
 
         self.control_frame = tk.Frame(root, bg=COLOR_PANEL_BG)
         self.control_frame.pack(pady=10)
 
+        # Compact auto run stats, refreshed once per poll while a run is going
+        self.stats_label = tk.Label(root, text="", font=FONT_STATUS_LABEL,
+                                    bg=COLOR_PANEL_BG, fg=COLOR_PANEL_FG)
+        self.stats_label.pack(pady=(0, 5))
+
         self.game_frame = tk.Frame(root, bg=COLOR_GAME_BG)
         self.game_frame.pack(padx=10, pady=(0, 10))
 
-        self.pixel_shim = tk.PhotoImage(width=1, height=1)
-
         self.setup_game()
 
+    def window_title(self):
+        return f"Minesweeper CSP vs CP ({self.board_cols}x{self.board_rows})"
+
     def setup_game(self):
+        self.scheduler.cancel()
         for widget in self.game_frame.winfo_children():
             widget.destroy()
         for widget in self.control_frame.winfo_children():
             widget.destroy()
 
-        self.steps_left = STEP_LIMIT
-        self.game_over = False
-        self.bombs_flagged = 0
-        self.cells_opened = 0
-        self.board_logic = [[0 for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
-        self.board_status = [['H' for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
-
-        bombs_planted_count = 0
-        while bombs_planted_count < self.bomb_count:
-            row = random.randint(0, BOARD_SIZE - 1)
-            col = random.randint(0, BOARD_SIZE - 1)
-            if self.board_logic[row][col] == 0:
-                self.board_logic[row][col] = -1
-                bombs_planted_count += 1
-
-        self.calculate_neighbor_numbers()
+        self.engine.rows = self.board_rows
+        self.engine.cols = self.board_cols
+        self.engine.bomb_count = self.bomb_count
+        # Interactive games are unseeded; only auto runs deal from a seeded stream
+        self.engine.rng = random
+        self.engine.new_game()
+        self.game_over_shown = False
+        self.reveal_mode = None
+
         self.create_control_widgets()
         self.create_grid_widgets()
-        self.update_steps_display(count=0)
-
-    def calculate_neighbor_numbers(self):
-        for r in range(BOARD_SIZE):
-            for c in range(BOARD_SIZE):
-                if self.board_logic[r][c] == -1:
-                    continue
-                
-                bomb_neighbors_count = 0
-                for i in range(-1, 2):
-                    for j in range(-1, 2):
-                        if i == 0 and j == 0:
-                            continue
-                        neighbor_r, neighbor_c = r + i, c + j
-                        if 0 <= neighbor_r < BOARD_SIZE and 0 <= neighbor_c < BOARD_SIZE and \
-                           self.board_logic[neighbor_r][neighbor_c] == -1:
-                            bomb_neighbors_count += 1
-                self.board_logic[r][c] = bomb_neighbors_count
+        self.update_steps_display()
 
     def create_control_widgets(self):
+        # Board size inputs
+        tk.Label(self.control_frame, text="Size:", font=FONT_STATUS_LABEL,
+                 bg=COLOR_PANEL_BG, fg=COLOR_PANEL_FG).pack(side=tk.LEFT, padx=(10, 5), pady=5)
+
+        self.cols_var = tk.StringVar(value=str(self.board_cols))
+        self.cols_spinbox = tk.Spinbox(self.control_frame, from_=2, to=MAX_BOARD_SIZE, width=5,
+                                       textvariable=self.cols_var, command=self.on_board_size_changed)
+        self.cols_spinbox.pack(side=tk.LEFT, pady=5)
+        self.cols_spinbox.bind('<Return>', self.on_board_size_changed)
+
+        tk.Label(self.control_frame, text="x", font=FONT_STATUS_LABEL,
+                 bg=COLOR_PANEL_BG, fg=COLOR_PANEL_FG).pack(side=tk.LEFT, padx=2, pady=5)
+
+        self.rows_var = tk.StringVar(value=str(self.board_rows))
+        self.rows_spinbox = tk.Spinbox(self.control_frame, from_=2, to=MAX_BOARD_SIZE, width=5,
+                                       textvariable=self.rows_var, command=self.on_board_size_changed)
+        self.rows_spinbox.pack(side=tk.LEFT, padx=(0, 10), pady=5)
+        self.rows_spinbox.bind('<Return>', self.on_board_size_changed)
+
         # Bomb selection dropdown
-        tk.Label(self.control_frame, text="Bombs:", font=FONT_STATUS_LABEL, 
+        tk.Label(self.control_frame, text="Bombs:", font=FONT_STATUS_LABEL,
                  bg=COLOR_PANEL_BG, fg=COLOR_PANEL_FG).pack(side=tk.LEFT, padx=(10, 5), pady=5)
-        
+
         self.bomb_var = tk.StringVar(value=str(self.bomb_count))
-        self.bomb_dropdown = ttk.Combobox(self.control_frame, textvariable=self.bomb_var, 
-                                          values=['10', '20', '30'], state='readonly', width=5)
+        self.bomb_dropdown = ttk.Combobox(self.control_frame, textvariable=self.bomb_var,
+                                          values=['10', '20', '30'], width=7)
         self.bomb_dropdown.pack(side=tk.LEFT, padx=(0, 10), pady=5)
         self.bomb_dropdown.bind('<<ComboboxSelected>>', self.on_bomb_count_changed)
-        
-        self.steps_label = tk.Label(self.control_frame, text=f"Steps Left: {self.steps_left}",
+        self.bomb_dropdown.bind('<Return>', self.on_bomb_count_changed)
+
+        # CSP backend used by the CSP and Auto CSP buttons
+        tk.Label(self.control_frame, text="CSP:", font=FONT_STATUS_LABEL,
+                 bg=COLOR_PANEL_BG, fg=COLOR_PANEL_FG).pack(side=tk.LEFT, padx=(10, 5), pady=5)
+
+        self.csp_type_var = tk.StringVar(value=self.csp_solver_type)
+        self.csp_type_dropdown = ttk.Combobox(self.control_frame, textvariable=self.csp_type_var,
+                                              values=list(CSP_SOLVER_STEPS), state='readonly', width=7)
+        self.csp_type_dropdown.pack(side=tk.LEFT, padx=(0, 10), pady=5)
+        self.csp_type_dropdown.bind('<<ComboboxSelected>>', self.on_csp_type_changed)
+
+        # How the CP Solver / CSP Solver buttons pace their moves
+        tk.Label(self.control_frame, text="Pace:", font=FONT_STATUS_LABEL,
+                 bg=COLOR_PANEL_BG, fg=COLOR_PANEL_FG).pack(side=tk.LEFT, padx=(10, 5), pady=5)
+
+        self.pace_var = tk.StringVar(value=self.pace)
+        self.pace_dropdown = ttk.Combobox(self.control_frame, textvariable=self.pace_var,
+                                          values=list(SCHEDULERS), state='readonly', width=9)
+        self.pace_dropdown.pack(side=tk.LEFT, padx=(0, 10), pady=5)
+        self.pace_dropdown.bind('<<ComboboxSelected>>', self.on_pace_changed)
+
+        # Which auto run games get drawn; the others never touch a widget
+        tk.Label(self.control_frame, text="Render:", font=FONT_STATUS_LABEL,
+                 bg=COLOR_PANEL_BG, fg=COLOR_PANEL_FG).pack(side=tk.LEFT, padx=(10, 5), pady=5)
+
+        self.render_mode_var = tk.StringVar(value=self.auto_run_render_mode)
+        self.render_mode_dropdown = ttk.Combobox(self.control_frame, textvariable=self.render_mode_var,
+                                                 values=list(AUTO_RUN_RENDER_MODES), state='readonly',
+                                                 width=11)
+        self.render_mode_dropdown.pack(side=tk.LEFT, padx=(0, 10), pady=5)
+        self.render_mode_dropdown.bind('<<ComboboxSelected>>', self.on_render_mode_changed)
+
+        # Fixed-length auto runs, or runs that stop once the win rate is pinned down
+        tk.Label(self.control_frame, text="Run:", font=FONT_STATUS_LABEL,
+                 bg=COLOR_PANEL_BG, fg=COLOR_PANEL_FG).pack(side=tk.LEFT, padx=(10, 5), pady=5)
+
+        self.run_length_var = tk.StringVar(value=self.auto_run_length)
+        self.run_length_dropdown = ttk.Combobox(self.control_frame, textvariable=self.run_length_var,
+                                                values=list(AUTO_RUN_LENGTHS), state='readonly', width=6)
+        self.run_length_dropdown.pack(side=tk.LEFT, padx=(0, 10), pady=5)
+        self.run_length_dropdown.bind('<<ComboboxSelected>>', self.on_run_length_changed)
+
+        self.steps_label = tk.Label(self.control_frame, text=f"Steps Left: {self.engine.steps_left}",
                                      font=FONT_STATUS_LABEL, bg=COLOR_PANEL_BG, fg=COLOR_PANEL_FG)
         self.steps_label.pack(side=tk.LEFT, padx=10, pady=5)
 
-        self.bombs_label = tk.Label(self.control_frame, text=f"Flagged: {self.bombs_flagged}/{self.bomb_count}",
+        self.bombs_label = tk.Label(self.control_frame, text=f"Flagged: {self.engine.bombs_flagged}/{self.bomb_count}",
                                      font=FONT_STATUS_LABEL, bg=COLOR_PANEL_BG, fg=COLOR_PANEL_FG)
         self.bombs_label.pack(side=tk.LEFT, padx=10, pady=5)
 
@@ -143,16 +237,16 @@ class MinesweeperGUI:
         self.csp_button = tk.Button(self.control_frame, text="CSP Solver", state=tk.NORMAL,
                                      command=self.run_csp_solver, **button_style)
         self.csp_button.pack(side=tk.LEFT, padx=4)
-        
+
         # Auto run buttons
-        self.auto_cp_button = tk.Button(self.control_frame, text="Auto CP (1000x)",
+        self.auto_cp_button = tk.Button(self.control_frame, text=f"Auto CP ({self.auto_run_length})",
                                          command=self.run_auto_cp, **button_style)
         self.auto_cp_button.pack(side=tk.LEFT, padx=4)
-        
-        self.auto_csp_button = tk.Button(self.control_frame, text="Auto CSP (1000x)",
+
+        self.auto_csp_button = tk.Button(self.control_frame, text=f"Auto CSP ({self.auto_run_length})",
                                           command=self.run_auto_csp, **button_style)
         self.auto_csp_button.pack(side=tk.LEFT, padx=4)
-        
+
         # Stop button (initially hidden)
         stop_button_style = {
             'font': FONT_CONTROL_BTN,
@@ -174,594 +268,571 @@ class MinesweeperGUI:
         self.reset_button.pack(side=tk.LEFT, padx=(4, 10))
 
     def create_grid_widgets(self):
-        self.buttons = [[None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
-        for r in range(BOARD_SIZE):
-            for c in range(BOARD_SIZE):
-                button = tk.Button(self.game_frame, text=" ",
-                                   font=FONT_CELL_NUMBER,
-                                   bg=COLOR_CELL_HIDDEN,
-                                   activebackground="#B0B0B0",
-                                   relief=tk.FLAT,
-                                   bd=0,
-                                   image=self.pixel_shim, 
-                                   width=28, 
-                                   height=28,
-                                   compound='center' 
-                                  )
-
-                button.bind("<Button-1>", lambda event, row=r, col=c: self.handle_left_click(row, col))
-                button.bind("<Button-3>", lambda event, row=r, col=c: self.handle_right_click(row, col))
-
-                button.grid(row=r, column=c, padx=1, pady=1)
-                self.buttons[r][c] = button
-
-    def update_steps_display(self, count=1):
-        if self.game_over:
-            return
-
-        if count > 0:
-            self.steps_left -= count
-
-        self.steps_label.config(text=f"Steps Left: {self.steps_left}")
-
-        if self.steps_left < (STEP_LIMIT * 0.2):
+        board_width = self.board_cols * CELL_SIZE
+        board_height = self.board_rows * CELL_SIZE
+
+        self.canvas = tk.Canvas(self.game_frame,
+                                width=min(board_width, MAX_VIEW_WIDTH),
+                                height=min(board_height, MAX_VIEW_HEIGHT),
+                                bg=COLOR_GAME_BG,
+                                highlightthickness=0,
+                                scrollregion=(0, 0, board_width, board_height),
+                                xscrollincrement=CELL_SIZE,
+                                yscrollincrement=CELL_SIZE)
+        self.canvas.grid(row=0, column=0)
+
+        # Scrollbars only when the board does not fit the view
+        if board_width > MAX_VIEW_WIDTH:
+            x_scrollbar = tk.Scrollbar(self.game_frame, orient=tk.HORIZONTAL, command=self.on_scroll_x)
+            x_scrollbar.grid(row=1, column=0, sticky="ew")
+            self.canvas.config(xscrollcommand=x_scrollbar.set)
+        if board_height > MAX_VIEW_HEIGHT:
+            y_scrollbar = tk.Scrollbar(self.game_frame, orient=tk.VERTICAL, command=self.on_scroll_y)
+            y_scrollbar.grid(row=0, column=1, sticky="ns")
+            self.canvas.config(yscrollcommand=y_scrollbar.set)
+
+        # One handler per event for the whole board; the pixel position picks the cell
+        self.canvas.bind("<Button-1>", lambda event: self.on_canvas_click(event, self.handle_left_click))
+        self.canvas.bind("<Button-3>", lambda event: self.on_canvas_click(event, self.handle_right_click))
+        self.canvas.bind("<MouseWheel>", lambda event: self.scroll_by(0, -1 if event.delta > 0 else 1))
+        self.canvas.bind("<Shift-MouseWheel>", lambda event: self.scroll_by(-1 if event.delta > 0 else 1, 0))
+        self.canvas.bind("<Button-4>", lambda event: self.scroll_by(0, -1))
+        self.canvas.bind("<Button-5>", lambda event: self.scroll_by(0, 1))
+        self.canvas.bind("<Configure>", lambda event: self.draw_visible_cells())
+
+        # Canvas items [rectangle, text, last rendered appearance] of the drawn cells
+        self.cell_items = {}
+        # Drawn cells whose last rendered appearance is not HIDDEN_APPEARANCE
+        self.shown_cells = set()
+        # Cells to re-check on the next frame, and the pending frame callback
+        self.dirty_cells = set()
+        self.render_job = None
+        self.draw_visible_cells()
+
+    def on_canvas_click(self, event, handler):
+        r = int(self.canvas.canvasy(event.y)) // CELL_SIZE
+        c = int(self.canvas.canvasx(event.x)) // CELL_SIZE
+        if 0 <= r < self.board_rows and 0 <= c < self.board_cols:
+            handler(r, c)
+
+    def on_scroll_x(self, *args):
+        self.canvas.xview(*args)
+        self.draw_visible_cells()
+
+    def on_scroll_y(self, *args):
+        self.canvas.yview(*args)
+        self.draw_visible_cells()
+
+    def scroll_by(self, cols, rows):
+        if cols:
+            self.canvas.xview_scroll(cols, "units")
+        if rows:
+            self.canvas.yview_scroll(rows, "units")
+        self.draw_visible_cells()
+
+    def visible_cell_range(self):
+        """Returns (first row, end row, first col, end col) of the cells inside the view."""
+        view_width = self.canvas.winfo_width()
+        view_height = self.canvas.winfo_height()
+        if view_width <= 1:
+            view_width = int(self.canvas.cget("width"))
+            view_height = int(self.canvas.cget("height"))
+
+        left = int(self.canvas.canvasx(0))
+        top = int(self.canvas.canvasy(0))
+        return (max(top // CELL_SIZE, 0),
+                min((top + view_height) // CELL_SIZE + 1, self.board_rows),
+                max(left // CELL_SIZE, 0),
+                min((left + view_width) // CELL_SIZE + 1, self.board_cols))
+
+    def draw_visible_cells(self):
+        """Creates items for cells that scrolled into view and drops the ones that left it."""
+        r0, r1, c0, c1 = self.visible_cell_range()
+
+        for (r, c) in list(self.cell_items):
+            if not (r0 <= r < r1 and c0 <= c < c1):
+                rect, text, _ = self.cell_items.pop((r, c))
+                self.canvas.delete(rect, text)
+                self.shown_cells.discard((r, c))
+
+        for r in range(r0, r1):
+            for c in range(c0, c1):
+                if (r, c) in self.cell_items:
+                    continue
+                appearance = self.cell_appearance(r, c)
+                background, display_text, text_color = appearance
+                x = c * CELL_SIZE
+                y = r * CELL_SIZE
+                rect = self.canvas.create_rectangle(x + 1, y + 1, x + CELL_SIZE - 1, y + CELL_SIZE - 1,
+                                                    fill=background, outline="")
+                text = self.canvas.create_text(x + CELL_SIZE // 2, y + CELL_SIZE // 2,
+                                               text=display_text, fill=text_color, font=FONT_CELL_NUMBER)
+                self.cell_items[(r, c)] = [rect, text, appearance]
+                if appearance != HIDDEN_APPEARANCE:
+                    self.shown_cells.add((r, c))
+
+    def update_steps_display(self):
+        steps_left = self.engine.steps_left
+        self.steps_label.config(text=f"Steps Left: {steps_left}")
+
+        if steps_left < (self.engine.step_limit * 0.2):
             self.steps_label.config(fg="#FF4040")
-        elif self.steps_left < (STEP_LIMIT * 0.5):
+        elif steps_left < (self.engine.step_limit * 0.5):
             self.steps_label.config(fg="#FFA500")
         else:
             self.steps_label.config(fg=COLOR_PANEL_FG)
 
-        if self.steps_left <= 0 and count > 0:
-            self.game_over = True
-            if self.auto_run_active:
-                self.auto_run_losses += 1
-                self.continue_auto_run()
+    def cell_appearance(self, r, c):
+        """Returns (background, text, text color) of a cell for the current view."""
+        status = self.engine.board_status[r][c]
+        cell_value = self.engine.board_logic[r][c]
+
+        if (r, c) == self.engine.exploded_cell:
+            return "red", "💣", "black"
+
+        if status == 'F':
+            if self.reveal_mode == "bombs" and cell_value != -1:
+                return "white", "❌", "black"
+            if self.reveal_mode == "flags" and cell_value == -1:
+                return "lightgreen", "🚩", "black"
+            return COLOR_FLAG, "🚩", "black"
+
+        if cell_value == -1:
+            if self.reveal_mode == "bombs":
+                return "red", "💣", "black"
+            if self.reveal_mode == "flags":
+                return "lightgreen", "🚩", "black"
+        elif status == 'O' or self.reveal_mode is not None:
+            display_text = str(cell_value) if cell_value > 0 else ""
+            return COLOR_CELL_OPEN, display_text, NUMBER_COLOR_MAP.get(cell_value, "black")
+
+        return HIDDEN_APPEARANCE
+
+    def render_cells(self, cells):
+        """Queues cells for redraw; all queued cells are diffed and drawn once per frame."""
+        self.dirty_cells.update(cells)
+        if self.render_job is None:
+            self.render_job = self.root.after_idle(self.flush_render)
+
+    def flush_render(self):
+        """Pushes only the queued cells whose appearance differs from what is on the canvas."""
+        self.render_job = None
+        dirty_cells = self.dirty_cells
+        self.dirty_cells = set()
+
+        for cell in dirty_cells:
+            items = self.cell_items.get(cell)
+            if items is None:
+                continue
+
+            appearance = self.cell_appearance(*cell)
+            if appearance == items[2]:
+                continue
+
+            if appearance[0] != items[2][0]:
+                self.canvas.itemconfig(items[0], fill=appearance[0])
+            if appearance[1:] != items[2][1:]:
+                self.canvas.itemconfig(items[1], text=appearance[1], fill=appearance[2])
+            items[2] = appearance
+
+            if appearance == HIDDEN_APPEARANCE:
+                self.shown_cells.discard(cell)
             else:
-                messagebox.showerror("Game Over", "Out of steps! All bombs exploded.")
-                self.reveal_board(show_bombs=True)
+                self.shown_cells.add(cell)
 
-    def handle_left_click(self, r, c):
-        if self.game_over or self.board_status[r][c] != 'H':
-            return
+    def refresh_board(self):
+        """Renders every cell the engine changed and reports a finished game."""
+        self.render_cells(self.engine.drain_changed_cells())
 
+        self.bombs_label.config(text=f"Flagged: {self.engine.bombs_flagged}/{self.bomb_count}")
         self.update_steps_display()
 
-        if self.board_logic[r][c] == -1:
-            self.buttons[r][c].config(text="💣", bg="red", relief=tk.FLAT, state=tk.DISABLED)
-            self.game_over = True
-            if self.auto_run_active:
-                self.auto_run_losses += 1
-                self.continue_auto_run()
-            else:
+        if self.engine.game_over and not self.auto_run_active and not self.game_over_shown:
+            self.game_over_shown = True
+            if self.engine.result == RESULT_WIN:
+                messagebox.showinfo("Congratulations!", "You won!")
+                self.reveal_board(show_flags=True)
+            elif self.engine.result == RESULT_BOMB:
                 messagebox.showerror("Game Over", "You clicked on a bomb!")
                 self.reveal_board(show_bombs=True)
-        else:
-            self.open_cell_recursive(r, c)
-            self.check_win_condition()
+            else:
+                messagebox.showerror("Game Over", "Out of steps! All bombs exploded.")
+                self.reveal_board(show_bombs=True)
 
-    def handle_right_click(self, r, c):
-        if self.game_over:
+    def handle_left_click(self, r, c):
+        if self.engine.game_over:
             return
 
-        if self.board_status[r][c] == 'H':
-            self.board_status[r][c] = 'F'
-            self.buttons[r][c].config(text="🚩", bg=COLOR_FLAG)
-            self.bombs_flagged += 1
-        elif self.board_status[r][c] == 'F':
-            self.board_status[r][c] = 'H'
-            self.buttons[r][c].config(text=" ", bg=COLOR_CELL_HIDDEN)
-            self.bombs_flagged -= 1
-        
-        self.bombs_label.config(text=f"Flagged: {self.bombs_flagged}/{self.bomb_count}")
-
-    def open_cell_recursive(self, r, c):
-        if not (0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE):
-            return
-        if self.board_status[r][c] != 'H':
-            return
+        self.engine.open_cell(r, c)
+        self.refresh_board()
 
-        self.board_status[r][c] = 'O'
-        self.cells_opened += 1
-        cell_value = self.board_logic[r][c]
-
-        display_text = str(cell_value) if cell_value > 0 else ""
-        text_color = NUMBER_COLOR_MAP.get(cell_value, "black")
-
-        self.buttons[r][c].config(text=display_text,
-                                  bg=COLOR_CELL_OPEN,
-                                  relief=tk.FLAT,
-                                  font=FONT_CELL_NUMBER,
-                                  state=tk.DISABLED,
-                                  disabledforeground=text_color)
-
-        if cell_value == 0:
-            for i in range(-1, 2):
-                for j in range(-1, 2):
-                    if i == 0 and j == 0:
-                        continue
-                    self.open_cell_recursive(r + i, c + j)
-
-    def check_win_condition(self):
-        if self.game_over:
+    def handle_right_click(self, r, c):
+        if self.engine.game_over:
             return
-        
-        if self.cells_opened == (BOARD_SIZE * BOARD_SIZE) - self.bomb_count:
-            self.game_over = True
-            if self.auto_run_active:
-                self.auto_run_wins += 1
-                self.continue_auto_run()
-            else:
-                messagebox.showinfo("Congratulations!", "You won!")
-                self.reveal_board(show_flags=True)
 
-    def reveal_board(self, show_bombs=False, show_flags=False):
-        for r in range(BOARD_SIZE):
-            for c in range(BOARD_SIZE):
-                if self.board_status[r][c] == 'F':
-                    if show_bombs and self.board_logic[r][c] != -1:
-                        self.buttons[r][c].config(text="❌", bg="white", state=tk.DISABLED)
-                    elif show_flags and self.board_logic[r][c] == -1:
-                         self.buttons[r][c].config(text="🚩", bg="lightgreen", state=tk.DISABLED)
-                    continue
+        self.engine.toggle_flag(r, c)
+        self.refresh_board()
 
-                cell_value = self.board_logic[r][c]
-                if cell_value == -1:
-                    if show_bombs:
-                        self.buttons[r][c].config(text="💣", bg="red", state=tk.DISABLED)
-                    elif show_flags:
-                         self.buttons[r][c].config(text="🚩", bg="lightgreen", state=tk.DISABLED)
-                else:
-                    display_text = str(cell_value) if cell_value > 0 else ""
-                    text_color = NUMBER_COLOR_MAP.get(cell_value, "black")
-                    self.buttons[r][c].config(text=display_text, bg=COLOR_CELL_OPEN,
-                                              relief=tk.FLAT,
-                                              font=FONT_CELL_NUMBER,
-                                              state=tk.DISABLED,
-                                              disabledforeground=text_color)
+    def reveal_board(self, show_bombs=False, show_flags=False):
+        if show_bombs:
+            self.reveal_mode = "bombs"
+        elif show_flags:
+            self.reveal_mode = "flags"
+        self.render_cells(self.cell_items)
 
     # CP Solver
 
     def run_cp_solver(self):
         """Button handler for the 'CP Solver'."""
-        if self.game_over:
+        if self.engine.game_over:
             return
-            
-        if self.cells_opened == 0:
-            while True:
-                r = random.randint(0, BOARD_SIZE - 1)
-                c = random.randint(0, BOARD_SIZE - 1)
-                if self.board_logic[r][c] != -1:
-                    self.safe_ai_click(r,c) 
-                    self.update_steps_display() 
-                    break
-        
-        def solve_loop_cp():
-            if self.game_over:
-                return
-
-            change_made = self.cp_solver_step()
-            self.root.update() 
-            self.check_win_condition()
-            
-            if change_made and not self.game_over:
-                self.root.after(500, solve_loop_cp) 
-            elif not self.game_over:
-                messagebox.showinfo("CP Solver", "CP Solver stuck. No more 100% certain moves found.")
 
-        solve_loop_cp()
+        if self.engine.cells_opened == 0:
+            self.engine.first_safe_click()
+            self.refresh_board()
 
-    def cp_solver_step(self):
-        if self.game_over:
-            return False
-            
-        change_made_in_step = False
-        
-        for r in range(BOARD_SIZE):
-            for c in range(BOARD_SIZE):
-                if self.board_status[r][c] == 'O' and self.board_logic[r][c] > 0:
-                    cell_value = self.board_logic[r][c]
-                    
-                    hidden_neighbors = []
-                    flagged_neighbors_count = 0
-                    for i in range(-1, 2):
-                        for j in range(-1, 2):
-                            if i == 0 and j == 0: continue
-                            nr, nc = r + i, c + j
-                            if 0 <= nr < BOARD_SIZE and 0 <= nc < BOARD_SIZE:
-                                if self.board_status[nr][nc] == 'H':
-                                    hidden_neighbors.append((nr, nc))
-                                elif self.board_status[nr][nc] == 'F':
-                                    flagged_neighbors_count += 1
-                    
-                    if cell_value == (flagged_neighbors_count + len(hidden_neighbors)) and len(hidden_neighbors) > 0:
-                        for (nr, nc) in hidden_neighbors:
-                            self.board_status[nr][nc] = 'F'
-                            self.buttons[nr][nc].config(text="🚩", bg=COLOR_FLAG)
-                            self.bombs_flagged += 1
-                            change_made_in_step = True
-                        self.bombs_label.config(text=f"Flagged: {self.bombs_flagged}/{self.bomb_count}")
-
-                    if cell_value == flagged_neighbors_count and len(hidden_neighbors) > 0:
-                        for (nr, nc) in hidden_neighbors:
-                            self.open_cell_recursive(nr, nc)
-                            change_made_in_step = True
-                            
-        if change_made_in_step and not self.game_over:
-            self.update_steps_display()
-            
-        return change_made_in_step
+        def cp_step():
+            if self.engine.game_over:
+                return None
+
+            change_made = self.engine.cp_solver_step()
+            self.engine.check_win_condition()
+            self.refresh_board()
+
+            if change_made and not self.engine.game_over:
+                return CP_STEP_DELAY_MS
+            if not self.engine.game_over:
+                messagebox.showinfo("CP Solver", "CP Solver stuck. No more 100% certain moves found.")
+            return None
+
+        self.scheduler.run(cp_step)
 
     # CSP Solver
 
     def run_csp_solver(self):
         """Button handler for the 'CSP Solver'."""
-        if self.game_over:
-            return
-            
-        if self.cells_opened == 0:
-            while True:
-                r = random.randint(0, BOARD_SIZE - 1)
-                c = random.randint(0, BOARD_SIZE - 1)
-                if self.board_logic[r][c] != -1:
-                    self.safe_ai_click(r, c)
-                    self.update_steps_display() 
-                    break
-            self.root.update()
-
-        def solve_loop():
-            if self.game_over:
-                return
-
-            cp_made_move = self.cp_solver_step()
-            
-            if cp_made_move:
-                self.root.update()
-                self.check_win_condition()
-                if not self.game_over:
-                    self.root.after(500, solve_loop) 
-                return
-
-            csp_made_move = self.csp_solver_1ply_step()
-
-            if csp_made_move:
-                self.root.update()
-                self.check_win_condition()
-                if not self.game_over:
-                    self.root.after(750, solve_loop)
-                return
-            
-            if not self.game_over:
-                messagebox.showinfo("CSP Solver", "CSP Solver also stuck. Deeper search or guessing needed.")
-
-        solve_loop()
-
-    def csp_solver_1ply_step(self):
-        frontier_cells = self.get_frontier_cells()
-        
-        for (r, c) in frontier_cells:
-            
-            if self.check_immediate_contradiction(r, c, is_assumed_bomb=False):
-                self.board_status[r][c] = 'F'
-                self.buttons[r][c].config(text="🚩", bg=COLOR_FLAG) 
-                self.bombs_flagged += 1
-                self.bombs_label.config(text=f"Flagged: {self.bombs_flagged}/{self.bomb_count}")
-                if not self.game_over:
-                    self.update_steps_display() 
-                return True 
-
-            if self.check_immediate_contradiction(r, c, is_assumed_bomb=True):
-                self.safe_ai_click(r, c)
-                if not self.game_over:
-                    self.update_steps_display() 
-                return True 
-
-        return False
-
-    def get_frontier_cells(self):
-        frontier = set()
-        for r in range(BOARD_SIZE):
-            for c in range(BOARD_SIZE):
-                if self.board_status[r][c] == 'O' and self.board_logic[r][c] > 0:
-                    for i in range(-1, 2):
-                        for j in range(-1, 2):
-                            if i == 0 and j == 0: continue
-                            nr, nc = r + i, c + j
-                            if 0 <= nr < BOARD_SIZE and 0 <= nc < BOARD_SIZE and self.board_status[nr][nc] == 'H':
-                                frontier.add((nr, nc))
-        return list(frontier)
-
-    def check_immediate_contradiction(self, test_r, test_c, is_assumed_bomb):
-        for i_n in range(-1, 2):
-            for j_n in range(-1, 2):
-                if i_n == 0 and j_n == 0: continue
-                
-                neighbor_r, neighbor_c = test_r + i_n, test_c + j_n
-                
-                if not (0 <= neighbor_r < BOARD_SIZE and 0 <= neighbor_c < BOARD_SIZE and \
-                        self.board_status[neighbor_r][neighbor_c] == 'O' and \
-                        self.board_logic[neighbor_r][neighbor_c] > 0):
-                    continue
-                
-                number_cell_value = self.board_logic[neighbor_r][neighbor_c]
-                
-                hidden_count_around_num = 0
-                flag_count_around_num = 0
-                for i_nn in range(-1, 2):
-                    for j_nn in range(-1, 2):
-                        if i_nn == 0 and j_nn == 0: continue
-                        
-                        nn_r, nn_c = neighbor_r + i_nn, neighbor_c + j_nn
-                        
-                        if 0 <= nn_r < BOARD_SIZE and 0 <= nn_c < BOARD_SIZE:
-                            if self.board_status[nn_r][nn_c] == 'F':
-                                flag_count_around_num += 1
-                            elif nn_r == test_r and nn_c == test_c: 
-                                if is_assumed_bomb:
-                                    flag_count_around_num += 1
-                                else:
-                                    pass 
-                            elif self.board_status[nn_r][nn_c] == 'H':
-                                hidden_count_around_num += 1
-                
-                if flag_count_around_num > number_cell_value:
-                    return True 
-
-                if (flag_count_around_num + hidden_count_around_num) < number_cell_value:
-                    return True 
-
-        return False
-        
-    def safe_ai_click(self, r, c):
-        if self.game_over or self.board_status[r][c] != 'H':
-            return 
-        
-        if self.board_logic[r][c] == -1:
-            print(f"CSP ERROR: Attempted to open a bomb at [{r},{c}]")
+        if self.engine.game_over:
             return
-        else:
-            self.open_cell_recursive(r, c)
-    
+
+        if self.engine.cells_opened == 0:
+            self.engine.first_safe_click()
+            self.refresh_board()
+
+        def csp_step():
+            if self.engine.game_over:
+                return None
+
+            if self.engine.cp_solver_step():
+                delay_ms = CP_STEP_DELAY_MS
+            elif self.engine.csp_step(self.csp_solver_type):
+                delay_ms = CSP_STEP_DELAY_MS
+            else:
+                if not self.engine.game_over:
+                    messagebox.showinfo("CSP Solver", "CSP Solver also stuck. Deeper search or guessing needed.")
+                return None
+
+            self.engine.check_win_condition()
+            self.refresh_board()
+            return None if self.engine.game_over else delay_ms
+
+        self.scheduler.run(csp_step)
+
+    def on_csp_type_changed(self, event=None):
+        self.csp_solver_type = self.csp_type_var.get()
+
     def on_bomb_count_changed(self, event=None):
-        new_count = int(self.bomb_var.get())
-        if new_count != self.bomb_count:
+        self.on_board_size_changed()
+
+    def on_board_size_changed(self, event=None):
+        """Applies the size and bomb inputs, starting a new board if they changed."""
+        try:
+            new_rows = int(self.rows_var.get())
+            new_cols = int(self.cols_var.get())
+            new_count = int(self.bomb_var.get())
+        except ValueError:
+            new_rows, new_cols, new_count = 0, 0, 0
+
+        if not (2 <= new_rows <= MAX_BOARD_SIZE and 2 <= new_cols <= MAX_BOARD_SIZE
+                and 1 <= new_count < new_rows * new_cols):
+            messagebox.showwarning("Board Size", f"Width and height must be 2-{MAX_BOARD_SIZE} "
+                                                 "and bombs must be fewer than the number of cells.")
+            self.rows_var.set(str(self.board_rows))
+            self.cols_var.set(str(self.board_cols))
+            self.bomb_var.set(str(self.bomb_count))
+            return
+
+        if (new_rows, new_cols, new_count) != (self.board_rows, self.board_cols, self.bomb_count):
+            self.board_rows = new_rows
+            self.board_cols = new_cols
             self.bomb_count = new_count
+            self.root.title(self.window_title())
             self.setup_game()
-    
+
+    def on_pace_changed(self, event=None):
+        """Switches schedulers; a solver that is still running is stopped."""
+        self.scheduler.cancel()
+        self.pace = self.pace_var.get()
+        self.scheduler = SCHEDULERS[self.pace](self.root)
+
+    def on_render_mode_changed(self, event=None):
+        self.auto_run_render_mode = self.render_mode_var.get()
+
+    def on_run_length_changed(self, event=None):
+        self.auto_run_length = self.run_length_var.get()
+        self.auto_cp_button.config(text=f"Auto CP ({self.auto_run_length})")
+        self.auto_csp_button.config(text=f"Auto CSP ({self.auto_run_length})")
+
     def run_auto_cp(self):
-        if self.auto_run_active:
-            messagebox.showwarning("Auto Run", "Auto run already in progress!")
-            return
-        
-        self.auto_run_active = True
-        self.auto_run_count = 0
-        self.auto_run_wins = 0
-        self.auto_run_losses = 0
-        self.auto_run_solver_type = "CP"
-        
-        # Disable buttons and show stop button
-        self.cp_button.config(state=tk.DISABLED, bg='#CCCCCC', fg='#666666')
-        self.csp_button.config(state=tk.DISABLED, bg='#CCCCCC', fg='#666666')
-        self.auto_cp_button.config(state=tk.DISABLED, bg='#CCCCCC', fg='#666666')
-        self.auto_csp_button.config(state=tk.DISABLED, bg='#CCCCCC', fg='#666666')
-        self.bomb_dropdown.config(state=tk.DISABLED)
-        self.reset_button.pack_forget()
-        self.stop_button.pack(side=tk.LEFT, padx=(4, 10))
-        
-        self.root.title(f"Auto CP Running: 0/1000")
-        self.continue_auto_run()
-    
+        self.start_auto_run("CP")
+
     def run_auto_csp(self):
+        self.start_auto_run(self.csp_solver_type)
+
+    def start_auto_run(self, solver_type):
         if self.auto_run_active:
             messagebox.showwarning("Auto Run", "Auto run already in progress!")
             return
-        
+
+        self.scheduler.cancel()
         self.auto_run_active = True
-        self.auto_run_count = 0
-        self.auto_run_wins = 0
-        self.auto_run_losses = 0
-        self.auto_run_solver_type = "CSP"
-        
+        self.auto_run_target_reached = False
+        self.auto_run_counts = new_counts()
+        self.auto_run_solver_type = solver_type
+        # Game i of the run is dealt from game_rng(seed, i) and played from play_rng(seed, i),
+        # so batch.run_batch with this seed replays the same games
+        self.auto_run_seed = random.randrange(2 ** 32)
+        self.auto_run_started = time.perf_counter()
+        self.auto_run_precision = AUTO_RUN_LENGTHS[self.auto_run_length]
+        self.auto_run_max_games = AUTO_RUN_GAMES if self.auto_run_precision is None else EARLY_STOP_MAX_GAMES
+        if instrument.enabled:
+            instrument.reset()
+
         # Disable buttons and show stop button
         self.cp_button.config(state=tk.DISABLED, bg='#CCCCCC', fg='#666666')
         self.csp_button.config(state=tk.DISABLED, bg='#CCCCCC', fg='#666666')
         self.auto_cp_button.config(state=tk.DISABLED, bg='#CCCCCC', fg='#666666')
         self.auto_csp_button.config(state=tk.DISABLED, bg='#CCCCCC', fg='#666666')
         self.bomb_dropdown.config(state=tk.DISABLED)
+        self.csp_type_dropdown.config(state=tk.DISABLED)
+        self.render_mode_dropdown.config(state=tk.DISABLED)
+        self.run_length_dropdown.config(state=tk.DISABLED)
+        self.rows_spinbox.config(state=tk.DISABLED)
+        self.cols_spinbox.config(state=tk.DISABLED)
         self.reset_button.pack_forget()
         self.stop_button.pack(side=tk.LEFT, padx=(4, 10))
-        
-        self.root.title(f"Auto CSP Running: 0/1000")
-        self.continue_auto_run()
-    
+
+        self.update_auto_run_title()
+        self.update_auto_run_stats()
+
+        # The games are played on a worker thread; the Tk thread only polls for results
+        self.auto_run_queue = queue.Queue()
+        self.auto_run_stop = threading.Event()
+        self.auto_run_worker = threading.Thread(
+            target=play_auto_run, daemon=True,
+            args=(self.auto_run_queue, self.auto_run_stop, solver_type, self.auto_run_max_games,
+                  self.auto_run_seed, self.board_rows, self.board_cols, self.bomb_count, self.engine.step_limit,
+                  AUTO_RUN_RENDER_MODES[self.auto_run_render_mode]))
+        self.auto_run_worker.start()
+        self.root.after(AUTO_RUN_POLL_MS, self.poll_auto_run)
+
     def stop_auto_run(self):
         """Stop the auto run and show results for completed runs."""
         if not self.auto_run_active:
             return
-        
-        # Mark as inactive to stop the loop
+
+        # Mark as inactive to stop polling; the worker stops after its current game
         self.auto_run_active = False
-        
+        self.auto_run_stop.set()
+        self.auto_run_worker.join()
+
         # Show results for whatever has been completed
-        if self.auto_run_count > 0:
-            success_rate = (self.auto_run_wins / self.auto_run_count) * 100
-            
-            result_message = f"""Auto {self.auto_run_solver_type} Solver - STOPPED
-            
-Bomb Count: {self.bomb_count}
-Total Runs Completed: {self.auto_run_count}
-Wins: {self.auto_run_wins}
-Losses: {self.auto_run_losses}
-Success Rate: {success_rate:.1f}%"""
-            
+        self.report_instrumentation()
+        if self.auto_run_counts["games"] > 0:
+            result_message = format_summary(self.auto_run_solver_type, self.bomb_count,
+                                            self.auto_run_counts, stopped=True,
+                                            master_seed=self.auto_run_seed)
             messagebox.showinfo("Auto Run Stopped", result_message)
-        
+
         # Re-enable buttons and hide stop button
         self.cp_button.config(state=tk.NORMAL, bg=COLOR_PANEL_FG, fg=COLOR_PANEL_BG)
         self.csp_button.config(state=tk.NORMAL, bg=COLOR_PANEL_FG, fg=COLOR_PANEL_BG)
         self.auto_cp_button.config(state=tk.NORMAL, bg=COLOR_PANEL_FG, fg=COLOR_PANEL_BG)
         self.auto_csp_button.config(state=tk.NORMAL, bg=COLOR_PANEL_FG, fg=COLOR_PANEL_BG)
-        self.bomb_dropdown.config(state='readonly')
+        self.bomb_dropdown.config(state=tk.NORMAL)
+        self.csp_type_dropdown.config(state='readonly')
+        self.render_mode_dropdown.config(state='readonly')
+        self.run_length_dropdown.config(state='readonly')
+        self.rows_spinbox.config(state=tk.NORMAL)
+        self.cols_spinbox.config(state=tk.NORMAL)
         self.stop_button.pack_forget()
         self.reset_button.pack(side=tk.LEFT, padx=(4, 10))
-        
-        self.root.title("Minesweeper CSP vs CP (15x15)")
+
+        self.root.title(self.window_title())
         self.setup_game()
-    
-    def continue_auto_run(self):
+
+    def poll_auto_run(self):
+        """Collects the games the worker finished since the last poll and shows the latest rendered board.
+
+        A run with a precision target stops its worker as soon as the win-rate
+        interval is narrow enough. It finishes once the worker has posted the
+        board it stopped on; games played past the target are not counted.
+        """
         if not self.auto_run_active:
             return
-        
-        if self.auto_run_count >= 1000:
+
+        latest_engine = None
+        finished = False
+        while True:
+            try:
+                result = self.auto_run_queue.get_nowait()
+            except queue.Empty:
+                break
+            if result is None:
+                finished = True
+                break
+            outcome, engine = result
+            if engine is not None:
+                latest_engine = engine
+            if outcome is None or self.auto_run_target_reached:
+                continue
+            add_outcome(self.auto_run_counts, outcome)
+            if self.auto_run_precision_reached():
+                self.auto_run_target_reached = True
+                self.auto_run_stop.set()
+
+        if latest_engine is not None:
+            self.show_auto_run_board(latest_engine)
+        self.update_auto_run_title()
+        self.update_auto_run_stats()
+
+        if finished:
             self.finish_auto_run()
-            return
-        
-        # Check if current game is over
-        if self.game_over:
-            # Count as loss if game over and not a win
-            if self.cells_opened != (BOARD_SIZE * BOARD_SIZE) - self.bomb_count:
-                self.auto_run_losses += 1
-        
-        # Start next run
-        self.auto_run_count += 1
-        self.root.title(f"Auto {self.auto_run_solver_type} Running: {self.auto_run_count}/1000")
-        
-        # Reset game for next iteration
-        self.setup_game_for_auto_run()
-        
-        # Run solver after short delay to allow UI update
-        self.root.after(10, self.run_auto_solver_iteration)
-    
-    def setup_game_for_auto_run(self):
-        # Reset game state without recreating widgets
-        self.steps_left = STEP_LIMIT
-        self.game_over = False
-        self.bombs_flagged = 0
-        self.cells_opened = 0
-        self.board_logic = [[0 for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
-        self.board_status = [['H' for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
-
-        bombs_planted_count = 0
-        while bombs_planted_count < self.bomb_count:
-            row = random.randint(0, BOARD_SIZE - 1)
-            col = random.randint(0, BOARD_SIZE - 1)
-            if self.board_logic[row][col] == 0:
-                self.board_logic[row][col] = -1
-                bombs_planted_count += 1
-
-        self.calculate_neighbor_numbers()
-        
-        # Reset all buttons visually
-        for r in range(BOARD_SIZE):
-            for c in range(BOARD_SIZE):
-                self.buttons[r][c].config(text=" ", bg=COLOR_CELL_HIDDEN, 
-                                         relief=tk.FLAT, state=tk.NORMAL,
-                                         disabledforeground="black")
-        
-        self.update_steps_display(count=0)
-    
-    def run_auto_solver_iteration(self):
-        if self.auto_run_solver_type == "CP":
-            self.run_cp_solver_silent()
         else:
-            self.run_csp_solver_silent()
-    
-    def run_cp_solver_silent(self):
-        if self.game_over or not self.auto_run_active:
-            if self.auto_run_active:
-                self.continue_auto_run()
-            return
-            
-        if self.cells_opened == 0:
-            while True:
-                r = random.randint(0, BOARD_SIZE - 1)
-                c = random.randint(0, BOARD_SIZE - 1)
-                if self.board_logic[r][c] != -1:
-                    self.safe_ai_click(r, c) 
-                    self.update_steps_display() 
-                    break
-        
-        change_made = True
-        while change_made and not self.game_over and self.auto_run_active:
-            change_made = self.cp_solver_step()
-            self.root.update()
-            self.check_win_condition()
-            
-        # If stuck, count as loss and continue
-        if self.auto_run_active and not self.game_over and not change_made:
-            self.auto_run_losses += 1
-            self.continue_auto_run()
-    
-    def run_csp_solver_silent(self):
-        if self.game_over or not self.auto_run_active:
-            if self.auto_run_active:
-                self.continue_auto_run()
-            return
-            
-        if self.cells_opened == 0:
-            while True:
-                r = random.randint(0, BOARD_SIZE - 1)
-                c = random.randint(0, BOARD_SIZE - 1)
-                if self.board_logic[r][c] != -1:
-                    self.safe_ai_click(r, c)
-                    self.update_steps_display() 
-                    break
-            self.root.update()
-
-        while not self.game_over and self.auto_run_active:
-            cp_made_move = self.cp_solver_step()
-            self.root.update()
-            self.check_win_condition()
-            if self.game_over or not self.auto_run_active:
-                break 
-            
-            if cp_made_move:
-                continue
+            self.root.after(AUTO_RUN_POLL_MS, self.poll_auto_run)
 
-            csp_made_move = self.csp_solver_1ply_step()
-            self.root.update()
-            self.check_win_condition()
-            if self.game_over or not self.auto_run_active: 
-                break
+    def auto_run_precision_reached(self):
+        games = self.auto_run_counts["games"]
+        if self.auto_run_precision is None or games % EARLY_STOP_CHECK_GAMES:
+            return False
+        return precision_reached(self.auto_run_counts[OUTCOME_WIN], games, self.auto_run_precision)
+
+    def auto_run_progress(self):
+        """Games played so far, against the run length or the precision target."""
+        counts = self.auto_run_counts
+        if self.auto_run_precision is None:
+            return f"{counts['games']}/{self.auto_run_max_games}"
+        low, high = wilson_interval(counts[OUTCOME_WIN], counts["games"])
+        return f"{counts['games']} ±{(high - low) / 2 * 100:.1f}%/±{self.auto_run_precision * 100:g}%"
+
+    def update_auto_run_title(self):
+        counts = self.auto_run_counts
+        win_rate = counts[OUTCOME_WIN] / counts["games"] * 100 if counts["games"] else 0.0
+        self.root.title(f"Auto {self.auto_run_solver_type} Running: {self.auto_run_progress()}"
+                        f" - Win rate {win_rate:.1f}%")
+
+    def update_auto_run_stats(self):
+        counts = self.auto_run_counts
+        games = counts["games"]
+        elapsed = time.perf_counter() - self.auto_run_started
+        win_rate = counts[OUTCOME_WIN] / games * 100 if games else 0.0
+        rate = games / elapsed if elapsed > 0 else 0.0
+        self.stats_label.config(text=f"{self.auto_run_progress()}  W {counts[OUTCOME_WIN]}  "
+                                     f"L {counts[OUTCOME_LOSS]}  S {counts[OUTCOME_STUCK]}  "
+                                     f"{win_rate:.1f}%  {rate:.0f} games/s")
+
+    def show_auto_run_board(self, engine):
+        """Shows the final board of a finished auto run game; the worker never touches it again."""
+        self.engine = engine
+        self.reveal_mode = None
+
+        # Only cells that are not drawn as hidden can differ from a fresh board
+        self.render_cells(self.shown_cells)
+        self.refresh_board()
+
+    def report_instrumentation(self):
+        """Prints the aggregate report and writes the per-game one, when instrumentation is on."""
+        if not instrument.enabled:
+            return
+        print(instrument.format_report())
+        instrument.write_report()
+        print(f"Per-game report written to {instrument.REPORT_FILE}")
 
-            if not csp_made_move: 
-                # Stuck, count as loss
-                if self.auto_run_active:
-                    self.auto_run_losses += 1
-                    self.continue_auto_run()
-                break
-    
     def finish_auto_run(self):
         self.auto_run_active = False
-        
+        # The worker has posted its trailing None; wait for it to return before reading the instrument records
+        self.auto_run_worker.join()
+
         # Re-enable buttons and hide stop button
         self.cp_button.config(state=tk.NORMAL, bg=COLOR_PANEL_FG, fg=COLOR_PANEL_BG)
         self.csp_button.config(state=tk.NORMAL, bg=COLOR_PANEL_FG, fg=COLOR_PANEL_BG)
         self.auto_cp_button.config(state=tk.NORMAL, bg=COLOR_PANEL_FG, fg=COLOR_PANEL_BG)
         self.auto_csp_button.config(state=tk.NORMAL, bg=COLOR_PANEL_FG, fg=COLOR_PANEL_BG)
-        self.bomb_dropdown.config(state='readonly')
+        self.bomb_dropdown.config(state=tk.NORMAL)
+        self.csp_type_dropdown.config(state='readonly')
+        self.render_mode_dropdown.config(state='readonly')
+        self.run_length_dropdown.config(state='readonly')
+        self.rows_spinbox.config(state=tk.NORMAL)
+        self.cols_spinbox.config(state=tk.NORMAL)
         self.stop_button.pack_forget()
         self.reset_button.pack(side=tk.LEFT, padx=(4, 10))
-        
-        # Calculate statistics
-        success_rate = (self.auto_run_wins / 1000) * 100
-        
+
         # Show results
-        result_message = f"""Auto {self.auto_run_solver_type} Solver - 1000 Runs Completed
-        
-Bomb Count: {self.bomb_count}
-Total Runs: 1000
-Wins: {self.auto_run_wins}
-Losses: {self.auto_run_losses}
-Success Rate: {success_rate:.1f}%"""
-        
+        self.report_instrumentation()
+        result_message = format_summary(self.auto_run_solver_type, self.bomb_count, self.auto_run_counts,
+                                        master_seed=self.auto_run_seed)
         messagebox.showinfo("Auto Run Complete", result_message)
-        
-        self.root.title("Minesweeper CSP vs CP (15x15)")
+
+        self.root.title(self.window_title())
         self.setup_game()
 
+def play_auto_run(results, stop_event, solver_type, games, master_seed, rows, cols, bomb_count, step_limit,
+                  render_every=1):
+    """Auto run worker thread: plays the seeded games and posts (outcome, engine) for each.
+
+    Only every render_every-th game and the last one post their engine; the
+    rest post None in its place and their engine is reused for the next game.
+    A posted engine is never touched again, so the GUI can show that board
+    while the next one is played. None is posted once the run is over or stopped;
+    a stopped run first posts (None, engine) for its last game if that board
+    was not posted yet, so "Final only" still ends on a drawn board.
+    """
+    engine = None
+    for game_index in range(games):
+        if stop_event.is_set():
+            if engine is not None:
+                results.put((None, engine))
+            break
+        rng = game_rng(master_seed, game_index)
+        if engine is None:
+            engine = MinesweeperEngine(rows, bomb_count, step_limit, rng=rng, cols=cols)
+        else:
+            engine.rng = rng
+            engine.new_game()
+        engine.rng = play_rng(master_seed, game_index)
+        outcome = engine.play(solver_type)
+        if game_index == games - 1 or (render_every and (game_index + 1) % render_every == 0):
+            results.put((outcome, engine))
+            engine = None
+        else:
+            results.put((outcome, None))
+    results.put(None)
+
+
+# Phase timers, bound only when instrumentation is enabled
+instrument.register_phases(MinesweeperGUI, {"refresh_board": "render", "flush_render": "render"})
+
 # Main Program Execution
-if __name__ == "__main__":
+def main(argv=None, pace=DEFAULT_SCHEDULER):
     """Main entry point for the application."""
+    parser = argparse.ArgumentParser(description="Minesweeper with CP and CSP solvers.")
+    parser.add_argument("--pace", choices=list(SCHEDULERS), default=pace,
+                        help="how the interactive solvers pace their moves")
+    args = parser.parse_args(argv)
+
     root = tk.Tk()
-    app = MinesweeperGUI(root)
+    app = MinesweeperGUI(root, pace=args.pace)
     root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
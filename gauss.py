@@ -0,0 +1,200 @@
+from fractions import Fraction
+
+
+class LinearSystem:
+    """Sparse linear equations over cell variables, kept in reduced row echelon form.
+
+    Each row is stored under its pivot variable as (coefficients of the other
+    variables, right-hand side); a pivot appears in no other row. Adding an
+    equation reduces it against the existing rows and eliminates its new pivot
+    from them, so the work per equation grows with the rows it touches rather
+    than with the whole matrix.
+    """
+
+    def __init__(self):
+        self.rows = {}
+        self.occurs = {}
+        self.inconsistent = False
+
+    def add_equation(self, coeffs, rhs):
+        """Adds sum(coeffs[v] * v) == rhs; returns the new pivot, or None if it added nothing new."""
+        coeffs = {v: Fraction(a) for v, a in coeffs.items() if a}
+        rhs = Fraction(rhs)
+
+        # Substitute the existing pivots; their rows only hold non-pivot variables
+        for var in [v for v in coeffs if v in self.rows]:
+            a = coeffs.pop(var)
+            row, row_rhs = self.rows[var]
+            for v, b in row.items():
+                value = coeffs.get(v, 0) - a * b
+                if value:
+                    coeffs[v] = value
+                else:
+                    coeffs.pop(v, None)
+            rhs -= a * row_rhs
+
+        if not coeffs:
+            if rhs != 0:
+                self.inconsistent = True
+            return None
+
+        pivot = min(coeffs)
+        scale = coeffs.pop(pivot)
+        coeffs = {v: a / scale for v, a in coeffs.items()}
+        rhs /= scale
+
+        # Eliminate the new pivot from every row that mentions it
+        for other in self.occurs.pop(pivot, ()):
+            row, row_rhs = self.rows[other]
+            a = row.pop(pivot)
+            for v, b in coeffs.items():
+                value = row.get(v, 0) - a * b
+                if value:
+                    if v not in row:
+                        self.occurs.setdefault(v, set()).add(other)
+                    row[v] = value
+                elif v in row:
+                    del row[v]
+                    self.occurs[v].discard(other)
+            self.rows[other] = (row, row_rhs - a * rhs)
+
+        self.rows[pivot] = (coeffs, rhs)
+        for v in coeffs:
+            self.occurs.setdefault(v, set()).add(pivot)
+        return pivot
+
+    def value(self, var):
+        """Returns the value the equations pin var to, or None."""
+        row = self.rows.get(var)
+        if row is None or row[0]:
+            return None
+        return row[1]
+
+    def bound_deductions(self):
+        """Returns {variable: 0 or 1} forced by the bounds rule on some row.
+
+        With 0/1 variables a row can only reach its right-hand side at the
+        sum of its negative coefficients when every positive-coefficient
+        variable is 0 and every negative one 1, and symmetrically at the sum
+        of its positive coefficients.
+        """
+        forced = {}
+        for pivot, (row, rhs) in self.rows.items():
+            if not row:
+                continue
+            low = sum(a for a in row.values() if a < 0)
+            high = 1 + sum(a for a in row.values() if a > 0)
+            if rhs == low:
+                forced[pivot] = 0
+                for v, a in row.items():
+                    forced[v] = 0 if a > 0 else 1
+            elif rhs == high:
+                forced[pivot] = 1
+                for v, a in row.items():
+                    forced[v] = 1 if a > 0 else 0
+        return forced
+
+
+class FrontierEquations:
+    """One game's number equations, kept in an incremental LinearSystem.
+
+    Each opened number adds "sum of my unopened neighbors == value" once;
+    opened cells add "cell == 0" and flags "cell == 1". Removing a flag
+    invalidates the system, which is then rebuilt from the board.
+    """
+
+    def __init__(self):
+        self.system = LinearSystem()
+        self.encoded_numbers = set()
+        self.variables = set()
+        self.flag_facts = set()
+        self.known_cells = set()
+        self.open_equations = []
+
+    def sync(self, engine):
+        """Adds the numbers next to the frontier and the cells opened or flagged since the last call."""
+        board_status = engine.board_status
+        board_logic = engine.board_logic
+        if any(board_status[r][c] != 'F' for (r, c) in self.flag_facts):
+            self.__init__()
+
+        for (r, c) in engine.frontier:
+            for (nr, nc) in engine.neighbor_cells(r, c):
+                if (nr, nc) in self.encoded_numbers:
+                    continue
+                if board_status[nr][nc] != 'O' or board_logic[nr][nc] <= 0:
+                    continue
+                self.encoded_numbers.add((nr, nc))
+                unopened = [cell for cell in engine.neighbor_cells(nr, nc)
+                            if board_status[cell[0]][cell[1]] != 'O']
+                self.variables.update(unopened)
+                self.system.add_equation({cell: 1 for cell in unopened}, board_logic[nr][nc])
+                self.open_equations.append((unopened, board_logic[nr][nc]))
+
+        for cell in self.variables - self.known_cells:
+            status = board_status[cell[0]][cell[1]]
+            if status == 'O':
+                self.system.add_equation({cell: 1}, 0)
+                self.known_cells.add(cell)
+            elif status == 'F':
+                self.system.add_equation({cell: 1}, 1)
+                self.known_cells.add(cell)
+                self.flag_facts.add(cell)
+
+    def forced_moves(self, engine):
+        """Returns (safe cells, mine cells) among the hidden variables.
+
+        The bounds rule runs on the reduced rows and on the number equations
+        themselves, which a reduced row can mix beyond what the rule sees.
+        Deductions are added back as equations until they stop producing new
+        ones, so one call finds everything the rule reaches.
+        """
+        self.sync(engine)
+        system = self.system
+        while not system.inconsistent:
+            forced = system.bound_deductions()
+            forced.update(self.equation_deductions())
+            new_facts = [(v, value) for v, value in forced.items()
+                         if system.value(v) is None]
+            if not new_facts:
+                break
+            for v, value in new_facts:
+                system.add_equation({v: 1}, value)
+        if system.inconsistent:
+            return [], []
+
+        safe_cells = []
+        mine_cells = []
+        board_status = engine.board_status
+        for cell in sorted(self.variables):
+            if board_status[cell[0]][cell[1]] != 'H':
+                continue
+            value = system.value(cell)
+            if value == 0:
+                safe_cells.append(cell)
+            elif value == 1:
+                mine_cells.append(cell)
+        return safe_cells, mine_cells
+
+    def equation_deductions(self):
+        """Bounds rule on each number equation; drops the equations with no unknown left."""
+        forced = {}
+        still_open = []
+        for cells, value in self.open_equations:
+            unknown = []
+            mines = value
+            for cell in cells:
+                known = self.system.value(cell)
+                if known is None:
+                    unknown.append(cell)
+                else:
+                    mines -= known
+            if not unknown:
+                continue
+            still_open.append((cells, value))
+            if mines == 0:
+                forced.update((cell, 0) for cell in unknown)
+            elif mines == len(unknown):
+                forced.update((cell, 1) for cell in unknown)
+        self.open_equations = still_open
+        return forced
@@ -0,0 +1,199 @@
+import json
+import os
+import threading
+import time
+
+# Instrumentation is opt-in: set MINESWEEPER_INSTRUMENT=1 before starting, or call enable().
+# While it is off, the hooks below stay bound to no-ops and no method is wrapped.
+ENV_VAR = "MINESWEEPER_INSTRUMENT"
+REPORT_FILE = "instrument_report.json"
+
+enabled = False
+
+# (class, {method name: phase}) pairs wrapped with phase timers by enable()
+_phase_targets = []
+
+_games = []
+_current = None
+
+# Thread playing the current game; time and counts from any other thread (e.g. the
+# GUI rendering while a worker plays an auto run) go to _other_threads instead
+_game_thread = None
+_other_threads = None
+
+
+def new_record():
+    return {"outcome": None, "counters": {}, "phase_ns": {}, "phase_calls": {}}
+
+
+# No-op hooks, rebound to the recording versions by enable()
+
+def count(name, amount=1):
+    pass
+
+
+def start_game():
+    pass
+
+
+def end_game(outcome):
+    pass
+
+
+def _record():
+    """Returns the record the calling thread's counts and times belong to."""
+    if threading.get_ident() == _game_thread:
+        return _current
+    return _other_threads
+
+
+def _count(name, amount=1):
+    counters = _record()["counters"]
+    counters[name] = counters.get(name, 0) + amount
+
+
+def _start_game():
+    global _current, _game_thread
+    if _current["counters"] or _current["phase_ns"]:
+        _games.append(_current)
+    _current = new_record()
+    _game_thread = threading.get_ident()
+
+
+def _end_game(outcome):
+    _current["outcome"] = outcome
+
+
+def add_phase_time(phase, elapsed_ns):
+    record = _record()
+    phase_ns = record["phase_ns"]
+    phase_calls = record["phase_calls"]
+    phase_ns[phase] = phase_ns.get(phase, 0) + elapsed_ns
+    phase_calls[phase] = phase_calls.get(phase, 0) + 1
+
+
+def timed(phase, function):
+    """Returns function wrapped with a perf_counter_ns timer for phase, or function itself when disabled."""
+    if not enabled:
+        return function
+
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            add_phase_time(phase, time.perf_counter_ns() - start)
+    wrapper.__name__ = getattr(function, "__name__", phase)
+    wrapper.__doc__ = getattr(function, "__doc__", None)
+    return wrapper
+
+
+def register_phases(cls, phases):
+    """Times the listed methods of cls as phases whenever instrumentation is enabled."""
+    _phase_targets.append((cls, phases))
+    if enabled:
+        _wrap_phases(cls, phases)
+
+
+def _wrap_phases(cls, phases):
+    for name, phase in phases.items():
+        setattr(cls, name, timed(phase, cls.__dict__[name]))
+
+
+def enable():
+    """Binds the recording hooks and wraps every registered phase method; idempotent."""
+    global enabled, count, start_game, end_game
+    if enabled:
+        return
+    enabled = True
+    count, start_game, end_game = _count, _start_game, _end_game
+    reset()
+    for cls, phases in _phase_targets:
+        _wrap_phases(cls, phases)
+
+
+def reset():
+    """Drops every recorded game, e.g. at the start of an auto run."""
+    global _current, _game_thread, _other_threads
+    _games.clear()
+    _current = new_record()
+    _game_thread = None
+    _other_threads = new_record()
+
+
+def other_thread_record():
+    """Returns what was recorded outside the thread playing the games, or None if nothing was."""
+    if _other_threads is not None and (_other_threads["counters"] or _other_threads["phase_ns"]):
+        return _other_threads
+    return None
+
+
+def game_records():
+    """Returns the per-game records, including the game in progress."""
+    if _current is not None and (_current["counters"] or _current["phase_ns"]):
+        return _games + [_current]
+    return list(_games)
+
+
+def aggregate(records):
+    """Sums the counters and phase timings of records into one record."""
+    total = new_record()
+    outcomes = {}
+    for record in records:
+        outcomes[record["outcome"]] = outcomes.get(record["outcome"], 0) + 1
+        for key in ("counters", "phase_ns", "phase_calls"):
+            for name, value in record[key].items():
+                total[key][name] = total[key].get(name, 0) + value
+    total["outcome"] = outcomes
+    return total
+
+
+def format_report(records=None):
+    """Builds the aggregate report text: phase times, counters and per-pass averages."""
+    if records is None:
+        records = game_records()
+    total = aggregate(records)
+    lines = [f"Instrumented games: {len(records)}"]
+
+    lines.append("Phases (inclusive):")
+    lines.extend(_phase_lines(total))
+
+    counters = total["counters"]
+    lines.append("Counters:")
+    for name, value in sorted(counters.items()):
+        lines.append(f"  {name:<18} {value}")
+
+    csp_passes = counters.get("csp_passes", 0)
+    if csp_passes:
+        lines.append(f"  frontier/pass      {counters.get('frontier_cells', 0) / csp_passes:.1f}")
+        lines.append(f"  deductions/pass    {counters.get('deductions', 0) / csp_passes:.2f}")
+
+    other = other_thread_record()
+    if other is not None:
+        lines.append("Other threads (not part of any game):")
+        lines.extend(_phase_lines(other))
+        for name, value in sorted(other["counters"].items()):
+            lines.append(f"  {name:<18} {value}")
+    return "\n".join(lines)
+
+
+def _phase_lines(record):
+    lines = []
+    for phase, elapsed_ns in sorted(record["phase_ns"].items(), key=lambda item: -item[1]):
+        calls = record["phase_calls"][phase]
+        lines.append(f"  {phase:<14} {elapsed_ns / 1e6:10.1f} ms  {calls:8d} calls  "
+                     f"{elapsed_ns / calls / 1e3:9.1f} us/call")
+    return lines
+
+
+def write_report(path=REPORT_FILE, records=None):
+    """Writes the per-game records, their aggregate and the other_threads record as JSON."""
+    if records is None:
+        records = game_records()
+    with open(path, "w") as f:
+        json.dump({"games": records, "aggregate": aggregate(records), "other_threads": other_thread_record()},
+                  f, indent=2)
+
+
+if os.environ.get(ENV_VAR, "") not in ("", "0"):
+    enable()
@@ -0,0 +1,91 @@
+import time
+
+# Pacing schedulers for the interactive solvers. A solver is a step function:
+# each call makes one move and returns the delay in ms the animated view waits
+# before the next one, or None once the solver is done. The scheduler decides
+# how the steps are actually spread over the Tk event loop. root is only used
+# through after(), after_cancel() and update_idletasks(), so this module does
+# not import tkinter.
+
+# Frame rate of the "Capped" scheduler
+DEFAULT_FPS = 30
+
+# How often the "Fast" scheduler hands control back to the event loop
+DEFAULT_YIELDS_PER_SECOND = 30
+
+
+class Scheduler:
+    """Runs one step function at a time; starting another cancels the pending one."""
+
+    def __init__(self, root):
+        self.root = root
+        self.pending = None
+
+    def run(self, step):
+        self.cancel()
+        self.loop(step)
+
+    def cancel(self):
+        if self.pending is not None:
+            self.root.after_cancel(self.pending)
+            self.pending = None
+
+    def schedule(self, delay_ms, step):
+        self.pending = self.root.after(delay_ms, self.resume, step)
+
+    def resume(self, step):
+        self.pending = None
+        self.loop(step)
+
+    def loop(self, step):
+        raise NotImplementedError
+
+
+class FixedDelayScheduler(Scheduler):
+    """Waits the delay each step asks for, so every move can be watched."""
+
+    def loop(self, step):
+        delay_ms = step()
+        if delay_ms is not None:
+            self.schedule(delay_ms, step)
+
+
+class FrameRateScheduler(Scheduler):
+    """Runs one step per frame, at most fps frames a second."""
+
+    def __init__(self, root, fps=DEFAULT_FPS):
+        super().__init__(root)
+        self.frame_ms = 1000 / fps
+
+    def loop(self, step):
+        start = time.perf_counter()
+        if step() is None:
+            return
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.schedule(max(1, int(self.frame_ms - elapsed_ms)), step)
+
+
+class FastScheduler(Scheduler):
+    """Runs steps back to back and yields to the event loop only yields_per_second times a second.
+
+    Each yield flushes the idle tasks (the queued board redraw) and re-enters
+    through after(), so input such as Reset is handled between time slices
+    without calling root.update() after every move.
+    """
+
+    def __init__(self, root, yields_per_second=DEFAULT_YIELDS_PER_SECOND):
+        super().__init__(root)
+        self.slice_seconds = 1 / yields_per_second
+
+    def loop(self, step):
+        deadline = time.perf_counter() + self.slice_seconds
+        while step() is not None:
+            if time.perf_counter() >= deadline:
+                self.root.update_idletasks()
+                self.schedule(1, step)
+                return
+
+
+# Scheduler names offered by the GUI and the --pace option
+SCHEDULERS = {"Animated": FixedDelayScheduler, "Capped": FrameRateScheduler, "Fast": FastScheduler}
+DEFAULT_SCHEDULER = "Animated"
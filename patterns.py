@@ -0,0 +1,86 @@
+import os
+
+from boardgen import NEIGHBOR_OFFSETS
+
+# Bit of each neighbor position of a number cell in the table masks
+OFFSET_BITS = {offset: 1 << i for i, offset in enumerate(NEIGHBOR_OFFSETS)}
+
+# Neighbor states in the packed code: opened or off the board, hidden, flagged
+STATE_OTHER = 0
+STATE_HIDDEN = 1
+STATE_FLAGGED = 2
+STATE_WEIGHTS = [3 ** i for i in range(8)]
+PATTERNS_PER_VALUE = 3 ** 8
+TABLE_SIZE = 9 * PATTERNS_PER_VALUE
+
+# Cached table, loaded instead of rebuilt when present
+PATTERN_TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "patterns.bin")
+
+_table = None
+
+
+def pattern_code(value, states):
+    """Packs a number cell's value and its 8 neighbor states into one table index."""
+    code = value * PATTERNS_PER_VALUE
+    for state, weight in zip(states, STATE_WEIGHTS):
+        code += state * weight
+    return code
+
+
+def build_table():
+    """Returns (mine_masks, safe_masks) for every packed 3x3 neighborhood.
+
+    For the neighborhood of one number cell, mine_masks[code] has the bits of
+    the hidden neighbors that must be mines and safe_masks[code] those that must
+    be safe. The rules are the ones check_immediate_contradiction applies to a
+    single number: a hidden neighbor is a mine when assuming it safe leaves too
+    few cells for the number, and safe when assuming it a mine overflows it.
+    """
+    mine_masks = bytearray(TABLE_SIZE)
+    safe_masks = bytearray(TABLE_SIZE)
+    for code in range(TABLE_SIZE):
+        value, pattern = divmod(code, PATTERNS_PER_VALUE)
+        hidden_bits = 0
+        hidden_count = 0
+        flag_count = 0
+        for i in range(8):
+            state = pattern // STATE_WEIGHTS[i] % 3
+            if state == STATE_HIDDEN:
+                hidden_bits |= 1 << i
+                hidden_count += 1
+            elif state == STATE_FLAGGED:
+                flag_count += 1
+        if not hidden_bits:
+            continue
+
+        if flag_count > value or flag_count + hidden_count - 1 < value:
+            mine_masks[code] = hidden_bits
+        if flag_count + 1 > value or flag_count + hidden_count < value:
+            safe_masks[code] = hidden_bits
+    return mine_masks, safe_masks
+
+
+def save_table(path=PATTERN_TABLE_FILE, table=None):
+    mine_masks, safe_masks = table if table is not None else pattern_table()
+    with open(path, "wb") as f:
+        f.write(mine_masks)
+        f.write(safe_masks)
+
+
+def load_table(path=PATTERN_TABLE_FILE):
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) != 2 * TABLE_SIZE:
+        raise ValueError(f"{path} is not a pattern table ({len(data)} bytes)")
+    return bytearray(data[:TABLE_SIZE]), bytearray(data[TABLE_SIZE:])
+
+
+def pattern_table():
+    """Returns the shared (mine_masks, safe_masks) table, loading or building it once."""
+    global _table
+    if _table is None:
+        if os.path.exists(PATTERN_TABLE_FILE):
+            _table = load_table(PATTERN_TABLE_FILE)
+        else:
+            _table = build_table()
+    return _table
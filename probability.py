@@ -0,0 +1,145 @@
+import math
+
+from csp import COMPONENT_NODE_LIMIT, forced_moves, solve_frontier
+
+
+def log_comb(n, k):
+    """Natural log of C(n, k), or None when C(n, k) is zero."""
+    if k < 0 or k > n:
+        return None
+    return math.lgamma(n + 1) - math.lgamma(k + 1) - math.lgamma(n - k + 1)
+
+
+def convolve(a, b):
+    """Multiplies two mine-count distributions (lists indexed by mine total)."""
+    result = [0.0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if not x:
+            continue
+        for j, y in enumerate(b):
+            result[i + j] += x * y
+    return result
+
+
+def normalized(distribution):
+    """Rescales a distribution to a maximum of 1; only ratios matter downstream."""
+    peak = max(distribution)
+    if peak == 0:
+        return distribution
+    return [value / peak for value in distribution]
+
+
+def mine_probabilities(engine, solved=None):
+    """Returns (frontier probabilities, interior probability, interior cell count).
+
+    Every solution of every frontier component is weighted by the number of ways
+    to place the remaining bomb_count - flags mines on the interior, i.e. the
+    hidden cells next to no opened number: C(interior cells, remaining - frontier
+    mines). The components are combined with a DP over their per-mine-total
+    solution counts, so the work grows with the number of components rather than
+    with the product of their solution counts. Cells of components that ran out
+    of search budget are counted as interior cells here, so the interior
+    probability is an approximation whenever there are such cells.
+    """
+    if solved is None:
+        solved, _ = solve_frontier(engine)
+
+    remaining_mines = engine.bomb_count - engine.bombs_flagged
+    hidden_count = engine.rows * engine.cols - engine.cells_opened - engine.bombs_flagged
+    interior_count = hidden_count - sum(len(cells) for cells, _, _ in solved)
+
+    # Weight of leaving j mines for the frontier: C(interior, remaining - j), as ratios
+    max_frontier_mines = sum(max(counts, default=0) for _, counts, _ in solved)
+    log_weights = [log_comb(interior_count, remaining_mines - j) for j in range(max_frontier_mines + 1)]
+    peak = max((w for w in log_weights if w is not None), default=None)
+    if peak is None:
+        return {}, 0.0, interior_count
+    interior_weights = [0.0 if w is None else math.exp(w - peak) for w in log_weights]
+
+    # Per component: solution counts indexed by mine total
+    distributions = []
+    for _, solution_counts, _ in solved:
+        distribution = [0.0] * (max(solution_counts, default=0) + 1)
+        for k, count in solution_counts.items():
+            distribution[k] = float(count)
+        distributions.append(normalized(distribution))
+
+    # prefix[i] / suffix[i] combine the components before / from i
+    prefix = [[1.0]]
+    for distribution in distributions:
+        prefix.append(normalized(convolve(prefix[-1], distribution)))
+    suffix = [[1.0]]
+    for distribution in reversed(distributions):
+        suffix.append(normalized(convolve(suffix[-1], distribution)))
+    suffix.reverse()
+
+    probabilities = {}
+    for i, (cells, solution_counts, mine_counts) in enumerate(solved):
+        others = convolve(prefix[i], suffix[i + 1])
+        total = 0.0
+        cell_weights = [0.0] * len(cells)
+        for k, count in solution_counts.items():
+            # Weight of every completion of this component's k-mine solutions
+            rest = sum(ways * interior_weights[k + j]
+                       for j, ways in enumerate(others) if ways and k + j < len(interior_weights))
+            total += count * rest
+            for v, mines in enumerate(mine_counts[k]):
+                cell_weights[v] += mines * rest
+        for v, cell in enumerate(cells):
+            probabilities[cell] = cell_weights[v] / total if total else 0.0
+
+    interior_probability = 0.0
+    if interior_count > 0:
+        frontier = prefix[-1]
+        total = 0.0
+        expected_interior_mines = 0.0
+        for j, ways in enumerate(frontier):
+            if ways and j < len(interior_weights):
+                weight = ways * interior_weights[j]
+                total += weight
+                expected_interior_mines += weight * (remaining_mines - j)
+        if total:
+            interior_probability = expected_interior_mines / total / interior_count
+
+    return probabilities, interior_probability, interior_count
+
+
+def best_guess(engine, solved=None, unsolved_cells=()):
+    """Returns the hidden cell least likely to be a mine and its mine probability.
+
+    The cells in unsolved_cells (of components that ran out of search budget)
+    touch opened numbers, so the interior probability says little about them;
+    they are only guessed when no other hidden cell is left.
+    """
+    if solved is None:
+        solved, unsolved = solve_frontier(engine)
+        unsolved_cells = [cell for cells, _ in unsolved for cell in cells]
+    probabilities, interior_probability, interior_count = mine_probabilities(engine, solved)
+
+    best_cell = None
+    best_probability = 2.0
+    for cell in sorted(probabilities):
+        if probabilities[cell] < best_probability:
+            best_cell, best_probability = cell, probabilities[cell]
+
+    if interior_count > 0 and interior_probability < best_probability:
+        excluded = set(probabilities).union(unsolved_cells)
+        interior_cells = [(r, c) for r in range(engine.rows) for c in range(engine.cols)
+                          if engine.board_status[r][c] == 'H' and (r, c) not in excluded]
+        if not interior_cells and best_cell is None:
+            interior_cells = sorted(unsolved_cells)
+        if interior_cells:
+            best_cell = engine.rng.choice(interior_cells)
+            best_probability = interior_probability
+
+    return best_cell, best_probability
+
+
+def probability_step_moves(engine, node_limit=COMPONENT_NODE_LIMIT):
+    """Returns (safe cells, mine cells, guess): forced moves, or else the best guess."""
+    solved, unsolved = solve_frontier(engine, node_limit)
+    safe_cells, mine_cells = forced_moves(engine, node_limit, solved, unsolved)
+    if safe_cells or mine_cells:
+        return safe_cells, mine_cells, None
+    guess, _ = best_guess(engine, solved, [cell for cells, _ in unsolved for cell in cells])
+    return [], [], guess
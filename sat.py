@@ -0,0 +1,365 @@
+import heapq
+from itertools import combinations
+
+# VSIDS activity decay and restart schedule
+ACTIVITY_DECAY = 0.95
+FIRST_RESTART = 100
+RESTART_GROWTH = 1.5
+
+
+class SatSolver:
+    """Incremental CDCL SAT solver with two watched literals.
+
+    Variables are the positive ints returned by new_var() and a literal is +v
+    or -v. Clauses, learned clauses and level-0 facts persist across solve()
+    calls; assumptions only hold for the call they are passed to.
+    """
+
+    def __init__(self):
+        self.num_vars = 0
+        self.clauses = []
+        self.watches = [[], []]
+        self.values = [None]
+        self.levels = [0]
+        self.reasons = [None]
+        self.activity = [0.0]
+        self.phase = [False]
+        self.activity_inc = 1.0
+        self.order_heap = []
+        self.trail = []
+        self.trail_lim = []
+        self.propagate_head = 0
+        self.unsat = False
+        self.model = None
+        self.learned_count = 0
+        self.conflict_count = 0
+
+    def new_var(self):
+        self.num_vars += 1
+        self.watches += [[], []]
+        self.values.append(None)
+        self.levels.append(0)
+        self.reasons.append(None)
+        self.activity.append(0.0)
+        self.phase.append(False)
+        heapq.heappush(self.order_heap, (0.0, self.num_vars))
+        return self.num_vars
+
+    # Literals
+
+    @staticmethod
+    def watch_index(lit):
+        return 2 * lit if lit > 0 else -2 * lit + 1
+
+    def lit_value(self, lit):
+        value = self.values[lit if lit > 0 else -lit]
+        if value is None:
+            return None
+        return value if lit > 0 else not value
+
+    def assign(self, lit, reason):
+        v = lit if lit > 0 else -lit
+        self.values[v] = lit > 0
+        self.levels[v] = len(self.trail_lim)
+        self.reasons[v] = reason
+        self.trail.append(lit)
+
+    # Clauses
+
+    def add_clause(self, lits):
+        """Adds a permanent clause; returns False once the clauses are unsatisfiable."""
+        if self.unsat:
+            return False
+        self.cancel_until(0)
+
+        clause = []
+        for lit in lits:
+            value = self.lit_value(lit)
+            if value is True or -lit in clause:
+                return True
+            if value is None and lit not in clause:
+                clause.append(lit)
+
+        if not clause:
+            self.unsat = True
+            return False
+        if len(clause) == 1:
+            self.assign(clause[0], None)
+            if self.propagate() is not None:
+                self.unsat = True
+                return False
+            return True
+
+        self.attach(clause)
+        return True
+
+    def attach(self, clause):
+        self.clauses.append(clause)
+        ci = len(self.clauses) - 1
+        self.watches[self.watch_index(clause[0])].append(ci)
+        self.watches[self.watch_index(clause[1])].append(ci)
+        return ci
+
+    def add_exactly(self, lits, k):
+        """Adds clauses saying exactly k of lits are true (fine for the <= 8 literals of a number)."""
+        n = len(lits)
+        if k < 0 or k > n:
+            return self.add_clause([])
+        # At most k: no k + 1 of them all true
+        for subset in combinations(lits, k + 1):
+            self.add_clause([-lit for lit in subset])
+        # At least k: no n - k + 1 of them all false
+        for subset in combinations(lits, n - k + 1):
+            self.add_clause(list(subset))
+        return not self.unsat
+
+    # Search
+
+    def propagate(self):
+        """Unit propagation over the watched literals; returns a conflicting clause index or None."""
+        clauses = self.clauses
+        watches = self.watches
+        lit_value = self.lit_value
+        while self.propagate_head < len(self.trail):
+            false_lit = -self.trail[self.propagate_head]
+            self.propagate_head += 1
+            watch_list = watches[self.watch_index(false_lit)]
+            kept = []
+            conflict = None
+            for k, ci in enumerate(watch_list):
+                clause = clauses[ci]
+                if clause[0] == false_lit:
+                    clause[0], clause[1] = clause[1], false_lit
+                first = clause[0]
+                if lit_value(first) is True:
+                    kept.append(ci)
+                    continue
+
+                for m in range(2, len(clause)):
+                    if lit_value(clause[m]) is not False:
+                        clause[1], clause[m] = clause[m], false_lit
+                        watches[self.watch_index(clause[1])].append(ci)
+                        break
+                else:
+                    kept.append(ci)
+                    if lit_value(first) is False:
+                        conflict = ci
+                        kept.extend(watch_list[k + 1:])
+                        break
+                    self.assign(first, ci)
+            watches[self.watch_index(false_lit)] = kept
+            if conflict is not None:
+                return conflict
+        return None
+
+    def analyze(self, conflict):
+        """First-UIP conflict analysis; returns (learned clause, backjump level)."""
+        level = len(self.trail_lim)
+        learned = [None]
+        seen = set()
+        counter = 0
+        lit = None
+        index = len(self.trail) - 1
+        clause = self.clauses[conflict]
+        while True:
+            for q in clause:
+                if q == lit:
+                    continue
+                v = q if q > 0 else -q
+                if v in seen or self.levels[v] == 0:
+                    continue
+                seen.add(v)
+                self.bump(v)
+                if self.levels[v] == level:
+                    counter += 1
+                else:
+                    learned.append(q)
+
+            while abs(self.trail[index]) not in seen:
+                index -= 1
+            lit = self.trail[index]
+            index -= 1
+            seen.discard(abs(lit))
+            counter -= 1
+            if counter == 0:
+                break
+            clause = self.clauses[self.reasons[abs(lit)]]
+
+        learned[0] = -lit
+        backjump_level = 0
+        if len(learned) > 1:
+            # Watch the literal assigned at the highest remaining level second
+            best = max(range(1, len(learned)), key=lambda i: self.levels[abs(learned[i])])
+            learned[1], learned[best] = learned[best], learned[1]
+            backjump_level = self.levels[abs(learned[1])]
+        return learned, backjump_level
+
+    def bump(self, v):
+        self.activity[v] += self.activity_inc
+        if self.activity[v] > 1e100:
+            self.activity = [a * 1e-100 for a in self.activity]
+            self.activity_inc *= 1e-100
+            self.order_heap = [(-self.activity[u], u) for u in range(1, self.num_vars + 1)
+                               if self.values[u] is None]
+            heapq.heapify(self.order_heap)
+        elif self.values[v] is None:
+            heapq.heappush(self.order_heap, (-self.activity[v], v))
+
+    def cancel_until(self, level):
+        if len(self.trail_lim) <= level:
+            return
+        start = self.trail_lim[level]
+        for lit in self.trail[start:]:
+            v = lit if lit > 0 else -lit
+            self.phase[v] = self.values[v]
+            self.values[v] = None
+            self.reasons[v] = None
+            heapq.heappush(self.order_heap, (-self.activity[v], v))
+        del self.trail[start:]
+        del self.trail_lim[level:]
+        self.propagate_head = len(self.trail)
+
+    def pick_branch_var(self):
+        while self.order_heap:
+            _, v = heapq.heappop(self.order_heap)
+            if self.values[v] is None:
+                return v
+        return None
+
+    def solve(self, assumptions=()):
+        """Returns True and sets model when the clauses plus assumptions are satisfiable."""
+        self.model = None
+        if self.unsat:
+            return False
+        self.cancel_until(0)
+        if self.propagate() is not None:
+            self.unsat = True
+            return False
+        if len(self.order_heap) > 4 * self.num_vars + 64:
+            self.order_heap = [(-self.activity[v], v) for v in range(1, self.num_vars + 1)
+                               if self.values[v] is None]
+            heapq.heapify(self.order_heap)
+
+        restart_limit = FIRST_RESTART
+        conflicts = 0
+        while True:
+            conflict = self.propagate()
+            if conflict is not None:
+                self.conflict_count += 1
+                conflicts += 1
+                if not self.trail_lim:
+                    self.unsat = True
+                    return False
+                learned, backjump_level = self.analyze(conflict)
+                self.cancel_until(backjump_level)
+                if len(learned) == 1:
+                    self.assign(learned[0], None)
+                else:
+                    self.assign(learned[0], self.attach(learned))
+                    self.learned_count += 1
+                self.activity_inc /= ACTIVITY_DECAY
+                continue
+
+            if conflicts >= restart_limit:
+                conflicts = 0
+                restart_limit *= RESTART_GROWTH
+                self.cancel_until(0)
+                continue
+
+            # Assumptions are decided first, one level each
+            level = len(self.trail_lim)
+            if level < len(assumptions):
+                lit = assumptions[level]
+                value = self.lit_value(lit)
+                if value is False:
+                    self.cancel_until(0)
+                    return False
+                self.trail_lim.append(len(self.trail))
+                if value is None:
+                    self.assign(lit, None)
+                continue
+
+            v = self.pick_branch_var()
+            if v is None:
+                self.model = list(self.values)
+                self.cancel_until(0)
+                return True
+            self.trail_lim.append(len(self.trail))
+            self.assign(v if self.phase[v] else -v, None)
+
+
+class FrontierSat:
+    """One game's number constraints, kept in an incremental SatSolver.
+
+    Each opened number is encoded once, as "exactly value of my unopened
+    neighbors are mines". Opened cells become permanent safe facts and flags
+    are passed as assumptions, so unflagging a cell never invalidates what
+    the solver has learned.
+    """
+
+    def __init__(self):
+        self.solver = SatSolver()
+        self.cell_vars = {}
+        self.encoded_numbers = set()
+        self.unopened_cells = set()
+
+    def cell_var(self, cell):
+        v = self.cell_vars.get(cell)
+        if v is None:
+            v = self.cell_vars[cell] = self.solver.new_var()
+            self.unopened_cells.add(cell)
+        return v
+
+    def sync(self, engine):
+        """Adds the numbers next to the frontier and the cells opened since the last call."""
+        board_status = engine.board_status
+        board_logic = engine.board_logic
+        for (r, c) in engine.frontier:
+            for (nr, nc) in engine.neighbor_cells(r, c):
+                if (nr, nc) in self.encoded_numbers:
+                    continue
+                if board_status[nr][nc] != 'O' or board_logic[nr][nc] <= 0:
+                    continue
+                self.encoded_numbers.add((nr, nc))
+                unopened = [self.cell_var(cell) for cell in engine.neighbor_cells(nr, nc)
+                            if board_status[cell[0]][cell[1]] != 'O']
+                self.solver.add_exactly(unopened, board_logic[nr][nc])
+
+        for cell in [cell for cell in self.unopened_cells if board_status[cell[0]][cell[1]] == 'O']:
+            self.unopened_cells.discard(cell)
+            self.solver.add_clause([-self.cell_vars[cell]])
+
+    def forced_moves(self, engine):
+        """Returns (safe cells, mine cells) among the frontier cells.
+
+        A cell is forced when the opposite value makes the constraints
+        unsatisfiable. Every model found along the way clears the cells it
+        shows can go either way, so most cells need no solve of their own.
+        """
+        self.sync(engine)
+        solver = self.solver
+        board_status = engine.board_status
+        flags = [self.cell_vars[cell] for cell in self.unopened_cells
+                 if board_status[cell[0]][cell[1]] == 'F']
+        if not solver.solve(flags):
+            return [], []
+
+        model = solver.model
+        undecided = {cell: model[self.cell_vars[cell]] for cell in engine.frontier}
+        safe_cells = []
+        mine_cells = []
+        for cell in sorted(undecided):
+            if cell not in undecided:
+                continue
+            is_mine = undecided.pop(cell)
+            v = self.cell_vars[cell]
+            if solver.solve(flags + [-v if is_mine else v]):
+                other_model = solver.model
+                for other in [other for other, value in undecided.items()
+                              if other_model[self.cell_vars[other]] != value]:
+                    del undecided[other]
+            elif is_mine:
+                mine_cells.append(cell)
+            else:
+                safe_cells.append(cell)
+        return safe_cells, mine_cells
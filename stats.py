@@ -0,0 +1,184 @@
+import math
+from statistics import NormalDist
+
+# Confidence level and interval used when reporting a win rate
+DEFAULT_CONFIDENCE = 0.95
+DEFAULT_INTERVAL = "wilson"
+
+# Games played before an early-stopping run may stop, whatever its interval says
+MIN_GAMES = 100
+
+# Sequential comparison: the smallest difference in win rate between two
+# solvers worth telling apart, and the error rates of each one-sided test
+COMPARE_DELTA = 0.05
+COMPARE_ALPHA = 0.05
+COMPARE_BETA = 0.05
+
+# Decisions of SequentialComparison
+DECISION_A = "A"
+DECISION_B = "B"
+DECISION_EQUAL = "equal"
+
+
+def wilson_interval(wins, games, confidence=DEFAULT_CONFIDENCE):
+    """Returns the Wilson score interval (low, high) for a win rate of wins out of games."""
+    if games == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = wins / games
+    z2n = z * z / games
+    center = (p + z2n / 2) / (1 + z2n)
+    half = z / (1 + z2n) * math.sqrt(p * (1 - p) / games + z2n / (4 * games))
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def clopper_pearson_interval(wins, games, confidence=DEFAULT_CONFIDENCE):
+    """Returns the exact (Clopper-Pearson) interval (low, high); never narrower than it should be."""
+    if games == 0:
+        return 0.0, 1.0
+    alpha = 1 - confidence
+    low = 0.0 if wins == 0 else beta_quantile(alpha / 2, wins, games - wins + 1)
+    high = 1.0 if wins == games else beta_quantile(1 - alpha / 2, wins + 1, games - wins)
+    return low, high
+
+
+INTERVALS = {"wilson": wilson_interval, "clopper-pearson": clopper_pearson_interval}
+
+
+def win_rate_interval(wins, games, method=DEFAULT_INTERVAL, confidence=DEFAULT_CONFIDENCE):
+    return INTERVALS[method](wins, games, confidence)
+
+
+def precision_reached(wins, games, half_width, method=DEFAULT_INTERVAL, confidence=DEFAULT_CONFIDENCE,
+                      min_games=MIN_GAMES):
+    """True once at least min_games are played and the interval is at most +-half_width wide.
+
+    The width of the interval depends on the number of games much more than
+    on the observed rate, so stopping on it barely moves the coverage, unlike
+    stopping as soon as the rate looks good.
+    """
+    if games < min_games:
+        return False
+    low, high = win_rate_interval(wins, games, method, confidence)
+    return (high - low) / 2 <= half_width
+
+
+def format_interval(wins, games, method=DEFAULT_INTERVAL, confidence=DEFAULT_CONFIDENCE):
+    low, high = win_rate_interval(wins, games, method, confidence)
+    return f"{low * 100:.1f}% - {high * 100:.1f}% ({confidence:.0%} {method})"
+
+
+# Beta distribution, for the Clopper-Pearson bounds
+
+def regularized_beta(x, a, b):
+    """Returns I_x(a, b), the Beta(a, b) CDF at x, from its continued fraction."""
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    log_front = (math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                 + a * math.log(x) + b * math.log1p(-x))
+    # The fraction converges fast on this side of the mean; use the symmetry I_x(a, b) = 1 - I_1-x(b, a)
+    if x < (a + 1) / (a + b + 2):
+        return math.exp(log_front) * _beta_fraction(x, a, b) / a
+    return 1 - math.exp(log_front) * _beta_fraction(1 - x, b, a) / b
+
+
+def _beta_fraction(x, a, b, max_terms=10000, eps=1e-15):
+    # Modified Lentz evaluation of the continued fraction for I_x(a, b)
+    tiny = 1e-300
+    c = 1.0
+    d = 1 - (a + b) * x / (a + 1)
+    d = 1 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, max_terms + 1):
+        m2 = 2 * m
+        for numerator in (m * (b - m) * x / ((a + m2 - 1) * (a + m2)),
+                          -(a + m) * (a + b + m) * x / ((a + m2) * (a + m2 + 1))):
+            d = 1 + numerator * d
+            d = 1 / (d if abs(d) > tiny else tiny)
+            c = 1 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            h *= d * c
+        if abs(d * c - 1) < eps:
+            break
+    return h
+
+
+def beta_quantile(p, a, b):
+    """Returns x with I_x(a, b) == p, by bisection."""
+    low, high = 0.0, 1.0
+    for _ in range(100):
+        mid = (low + high) / 2
+        if regularized_beta(mid, a, b) < p:
+            low = mid
+        else:
+            high = mid
+        if high - low < 1e-10:
+            break
+    return (low + high) / 2
+
+
+class SequentialComparison:
+    """Sequential test of whether solver A or B wins more boards when both play the same ones.
+
+    Each board scores 1 when only A wins it, 0 when only B does and 1/2
+    otherwise, so the mean score is 0.5 + (win rate A - win rate B) / 2. Two
+    generalized SPRTs (normal approximation with the observed score variance)
+    run side by side. One tests a difference of 0 against +delta (A better)
+    and the other 0 against -delta (B better). The comparison is decided once
+    either finds its solver better, or both find no difference; neither test
+    may decide before min_games boards.
+    """
+
+    def __init__(self, delta=COMPARE_DELTA, alpha=COMPARE_ALPHA, beta=COMPARE_BETA, min_games=MIN_GAMES):
+        self.delta = delta
+        self.min_games = min_games
+        self.accept_bound = math.log((1 - beta) / alpha)
+        self.reject_bound = math.log(beta / (1 - alpha))
+        self.games = 0
+        self.a_only = 0
+        self.b_only = 0
+        self.a_verdict = None
+        self.b_verdict = None
+
+    def add(self, a_won, b_won):
+        """Records one board; returns the decision so far (DECISION_A, DECISION_B, DECISION_EQUAL or None)."""
+        self.games += 1
+        if a_won and not b_won:
+            self.a_only += 1
+        elif b_won and not a_won:
+            self.b_only += 1
+        if self.games >= self.min_games:
+            llr_a, llr_b = self.log_likelihood_ratios()
+            self.a_verdict = self.a_verdict or self.verdict(llr_a)
+            self.b_verdict = self.b_verdict or self.verdict(llr_b)
+        return self.decision()
+
+    def log_likelihood_ratios(self):
+        """Returns the LLRs of "A better" and of "B better", each against no difference."""
+        n = self.games
+        ties = n - self.a_only - self.b_only
+        mean = (self.a_only + ties / 2) / n
+        # Floor the variance so a run of ties reads as strong evidence instead of dividing by zero
+        variance = max((self.a_only + ties / 4) / n - mean * mean, 1e-6)
+        shift = self.delta / 2
+        llr_a = shift / variance * n * (mean - 0.5 - shift / 2)
+        llr_b = shift / variance * n * (0.5 - mean - shift / 2)
+        return llr_a, llr_b
+
+    def verdict(self, llr):
+        if llr >= self.accept_bound:
+            return "better"
+        if llr <= self.reject_bound:
+            return "same"
+        return None
+
+    def decision(self):
+        if self.a_verdict == "better":
+            return DECISION_A
+        if self.b_verdict == "better":
+            return DECISION_B
+        if self.a_verdict == "same" and self.b_verdict == "same":
+            return DECISION_EQUAL
+        return None
@@ -0,0 +1,241 @@
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from batch import add_outcome, new_counts, play_games
+from engine import BOARD_SIZE, DEFAULT_BOMB_COUNT, OUTCOME_LOSS, OUTCOME_STUCK, OUTCOME_WIN, STEP_LIMIT, SOLVER_TYPES
+from stats import DEFAULT_CONFIDENCE, wilson_interval
+
+# Games per grid cell, and games per task handed to a worker
+SWEEP_GAMES = 200
+SWEEP_CHUNK = 50
+
+# Completed cells are appended here, one JSON object per line
+CHECKPOINT_FILE = "sweep_checkpoint.jsonl"
+
+TABLE_FORMATS = ["text", "csv", "json"]
+
+# Fields that identify a cell in the checkpoint; the run settings are included so
+# a rerun with other settings does not pick up stale results
+KEY_FIELDS = ["rows", "cols", "mines", "step_limit", "solver", "games", "seed", "bitboard", "safe_first_click"]
+
+
+def parse_size(text):
+    """Parses "15" (square) or "30x16" (width x height) into (rows, cols)."""
+    width, sep, height = text.lower().partition("x")
+    if sep:
+        return int(height), int(width)
+    return int(width), int(width)
+
+
+def build_grid(sizes, mines=(), densities=(), step_limits=(STEP_LIMIT,), solvers=("CSP",)):
+    """Returns the cells of the grid in table order, and the (rows, cols, mines) combinations left out.
+
+    Mine counts come from mines as given and from densities times the cell
+    count; a combination with no safe cell, or no mine, is left out. Values
+    given twice on any axis are only played once.
+    """
+    cells = []
+    skipped = []
+    for rows, cols in dict.fromkeys(sizes):
+        mine_counts = list(mines) + [max(1, round(rows * cols * density)) for density in densities]
+        for bomb_count in dict.fromkeys(mine_counts):
+            if not 1 <= bomb_count < rows * cols:
+                skipped.append((rows, cols, bomb_count))
+                continue
+            for step_limit in dict.fromkeys(step_limits):
+                for solver in dict.fromkeys(solvers):
+                    cells.append({"rows": rows, "cols": cols, "mines": bomb_count,
+                                  "step_limit": step_limit, "solver": solver})
+    return cells, skipped
+
+
+def cell_key(record):
+    # Records from older checkpoints lack some fields; they then match no cell and are played again
+    return tuple(record.get(field) for field in KEY_FIELDS)
+
+
+def load_checkpoint(path):
+    """Returns {cell key: record} for every cell the checkpoint file holds."""
+    records = {}
+    if not os.path.exists(path):
+        return records
+    with open(path) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # The last line of a killed sweep can be cut short; that cell is simply played again
+                continue
+            records[cell_key(record)] = record
+    return records
+
+
+def run_sweep(cells, games=SWEEP_GAMES, master_seed=0, workers=None, checkpoint_path=CHECKPOINT_FILE,
+              bitboard=False, safe_first_click=False, progress=None):
+    """Plays every cell not already in the checkpoint and returns one record per cell, in cell order.
+
+    Each cell is split into SWEEP_CHUNK-game tasks for one process pool, so a
+    small grid still keeps every worker busy. A cell is appended (and synced)
+    to the checkpoint as soon as its last task finishes, so a killed sweep
+    loses at most the cells in flight. Every cell plays games 0..games-1 of the
+    same seeded batch, so cells with the same board size and mine count are
+    played on the same boards. progress, if given, is called with each newly
+    finished record.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    settings = {"games": games, "seed": master_seed, "bitboard": bitboard, "safe_first_click": safe_first_click}
+    records = load_checkpoint(checkpoint_path)
+    pending = {}
+    for cell in cells:
+        record = dict(cell, **settings)
+        # A cell listed twice is played once; its record then answers for both
+        if cell_key(record) not in records:
+            pending.setdefault(cell_key(record), record)
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        with open(checkpoint_path, "a") as checkpoint:
+            futures = {}
+            chunks_left = {}
+            counts = {}
+            for key, record in pending.items():
+                chunks_left[key] = 0
+                counts[key] = new_counts()
+                for start in range(0, games, SWEEP_CHUNK):
+                    future = executor.submit(play_games, record["solver"], start, min(start + SWEEP_CHUNK, games),
+                                             master_seed, record["rows"], record["mines"], record["step_limit"],
+                                             bitboard, None, safe_first_click, record["cols"])
+                    futures[future] = record
+                    chunks_left[key] += 1
+
+            for future in as_completed(futures):
+                record = futures[future]
+                key = cell_key(record)
+                for outcome in future.result():
+                    add_outcome(counts[key], outcome)
+                chunks_left[key] -= 1
+                if chunks_left[key]:
+                    continue
+
+                cell_counts = counts.pop(key)
+                record.update(win=cell_counts[OUTCOME_WIN], loss=cell_counts[OUTCOME_LOSS],
+                              stuck=cell_counts[OUTCOME_STUCK])
+                checkpoint.write(json.dumps(record) + "\n")
+                checkpoint.flush()
+                os.fsync(checkpoint.fileno())
+                records[key] = record
+                if progress is not None:
+                    progress(record)
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+    return [records[cell_key(dict(cell, **settings))] for cell in cells]
+
+
+def table_rows(records, confidence=DEFAULT_CONFIDENCE):
+    """Returns the consolidated table as a header and one row per record."""
+    header = ["size", "mines", "step_limit", "solver", "games", "win_rate", "interval_low", "interval_high",
+              "win", "loss", "stuck"]
+    rows = []
+    for record in records:
+        low, high = wilson_interval(record["win"], record["games"], confidence)
+        rows.append([f"{record['cols']}x{record['rows']}", record["mines"], record["step_limit"], record["solver"],
+                     record["games"], record["win"] / record["games"], low, high,
+                     record["win"], record["loss"], record["stuck"]])
+    return header, rows
+
+
+def format_table(records, confidence=DEFAULT_CONFIDENCE):
+    """Builds the aligned text table printed at the end of a sweep."""
+    _, rows = table_rows(records, confidence)
+    lines = [f"{'Size':<9} {'Mines':>6} {'Steps':>6} {'Solver':<7} {'Games':>6} {'Win%':>6} "
+             f"{f'{confidence:.0%} interval':>16} {'Loss':>6} {'Stuck':>6}"]
+    for size, mines, step_limit, solver, games, win_rate, low, high, _, loss, stuck in rows:
+        interval = f"{low * 100:.1f}-{high * 100:.1f}%"
+        lines.append(f"{size:<9} {mines:>6} {step_limit:>6} {solver:<7} {games:>6} {win_rate * 100:>5.1f}% "
+                     f"{interval:>16} {loss:>6} {stuck:>6}")
+    return "\n".join(lines)
+
+
+def write_table(out, records, table_format, confidence=DEFAULT_CONFIDENCE):
+    if table_format == "csv":
+        header, rows = table_rows(records, confidence)
+        writer = csv.writer(out)
+        writer.writerow(header)
+        writer.writerows(rows)
+    elif table_format == "json":
+        header, rows = table_rows(records, confidence)
+        json.dump([dict(zip(header, row)) for row in rows], out, indent=2)
+        out.write("\n")
+    else:
+        out.write(format_table(records, confidence) + "\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Play a grid of board sizes, mine counts, step limits and solvers, resuming from a checkpoint.")
+    parser.add_argument("--sizes", nargs="+", default=[str(BOARD_SIZE)], metavar="SIZE",
+                        help='board sizes, "15" for 15x15 or "30x16" for width x height')
+    parser.add_argument("--mines", type=int, nargs="+", default=[], help="mine counts")
+    parser.add_argument("--densities", type=float, nargs="+", default=[],
+                        help="mine counts as a fraction of the cells, e.g. 0.15")
+    parser.add_argument("--step-limits", type=int, nargs="+", default=[STEP_LIMIT])
+    parser.add_argument("--solvers", nargs="+", choices=SOLVER_TYPES, default=["CSP"])
+    parser.add_argument("--games", type=int, default=SWEEP_GAMES, help="games per cell")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--checkpoint", default=CHECKPOINT_FILE,
+                        help="completed cells are appended here; cells already in it are not played again")
+    parser.add_argument("--bitboard", action="store_true", help="play with BitboardEngine")
+    parser.add_argument("--safe-first-click", action="store_true",
+                        help="plant the mines only after the first click, away from it")
+    parser.add_argument("--format", choices=TABLE_FORMATS, default="text", dest="table_format")
+    parser.add_argument("--output", help="write the table here instead of stdout")
+    args = parser.parse_args(argv)
+
+    try:
+        sizes = [parse_size(size) for size in args.sizes]
+    except ValueError:
+        parser.error('sizes must look like "15" or "30x16"')
+    mines = args.mines if args.mines or args.densities else [DEFAULT_BOMB_COUNT]
+    if args.games < 1:
+        parser.error("--games must be at least 1")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if min(args.step_limits) < 1:
+        parser.error("--step-limits must be at least 1")
+
+    cells, skipped = build_grid(sizes, mines, args.densities, args.step_limits, args.solvers)
+    for rows, cols, bomb_count in skipped:
+        print(f"Skipping {cols}x{rows} with {bomb_count} mines", file=sys.stderr)
+    if not cells:
+        parser.error("the grid has no playable cells")
+
+    def progress(record):
+        print(f"Done {record['cols']}x{record['rows']}/{record['mines']} steps {record['step_limit']} "
+              f"{record['solver']}: {record['win']}/{record['games']} won", file=sys.stderr)
+
+    try:
+        records = run_sweep(cells, args.games, args.seed, args.workers, args.checkpoint, args.bitboard,
+                            args.safe_first_click, progress)
+    except KeyboardInterrupt:
+        print(f"Interrupted; finished cells are saved in {args.checkpoint}. "
+              "Rerun the same command to resume.", file=sys.stderr)
+        return 130
+
+    if args.output:
+        with open(args.output, "w", newline="") as out:
+            write_table(out, records, args.table_format)
+    else:
+        write_table(sys.stdout, records, args.table_format)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())